@@ -2,18 +2,27 @@ from flask import Flask
 from flask_cors import CORS
 import os
 
+from .json_provider import OrjsonProvider, orjson
 
-def create_app() -> Flask:
+
+def create_app(testing: bool = False) -> Flask:
     app = Flask(__name__)
 
+    # Serialize API responses with orjson when available
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
     # Configuration
     app.config["JSON_SORT_KEYS"] = False
+    app.config["TESTING"] = testing
 
-    # CORS origins from env or defaults for Vite dev server
-    allowed_origins = os.getenv("CORS_ORIGINS", "http://localhost:5173,http://127.0.0.1:5173")
-    origins = [origin.strip() for origin in allowed_origins.split(",") if origin.strip()]
+    # CORS is only needed for browser clients; skip it under the test client
+    if not app.config.get("TESTING"):
+        # CORS origins from env or defaults for Vite dev server
+        allowed_origins = os.getenv("CORS_ORIGINS", "http://localhost:5173,http://127.0.0.1:5173")
+        origins = [origin.strip() for origin in allowed_origins.split(",") if origin.strip()]
 
-    CORS(app, resources={r"/api/*": {"origins": origins}})
+        CORS(app, resources={r"/api/*": {"origins": origins}})
 
     # Register blueprints
     from .api.routes import api_blueprint
@@ -1,4 +1,5 @@
 from flask import Blueprint, jsonify, request
+from functools import lru_cache
 import logging
 
 # Configure logging
@@ -368,6 +369,7 @@ def analyze_with_ai():
         }), 500
 
 
+@lru_cache(maxsize=16)
 def _get_provider_description(provider):
     """Get human-readable description for AI provider."""
     descriptions = {
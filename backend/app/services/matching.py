@@ -1,8 +1,10 @@
 import re
-import json
+import math
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Set, Tuple
-from .rules_loader import get_paragraphs, get_mappings, get_paragraph_text
+from .rules_loader import get_paragraphs, get_mappings, get_paragraph_text, load_json
 
 # ---------- Business Logic Helpers ----------
 
@@ -13,6 +15,10 @@ def _to_float(x: Any) -> Optional[float]:
     except (TypeError, ValueError):
         return None
 
+# Attribute values that imply the legacy uses_gas/serves_meat flags
+_GAS_TERMS = frozenset(["uses_gas", "gas", "גז"])
+_MEAT_TERMS = frozenset(["serves_meat", "meat", "בשר"])
+
 def _normalize_user_input(answers: Dict[str, Any]) -> Dict[str, Any]:
     """
     Normalize user input for consistent processing.
@@ -29,34 +35,83 @@ def _normalize_user_input(answers: Dict[str, Any]) -> Dict[str, Any]:
     if seats is None:
         seats = _to_float(answers.get("seating"))
 
-    attrs = list(str(attr).lower() for attr in (answers.get("attributes") or []))
+    attrs = [str(attr).lower() for attr in (answers.get("attributes") or [])]
+    attr_set = frozenset(attrs)
     
     # Extract boolean flags from various sources
     uses_gas = answers.get("uses_gas")
     if uses_gas is None:
-        uses_gas = any(gas_term in attrs for gas_term in ["uses_gas", "gas", "גז"])
+        uses_gas = not _GAS_TERMS.isdisjoint(attr_set)
 
     serves_meat = answers.get("serves_meat")
     if serves_meat is None:
-        serves_meat = any(meat_term in attrs for meat_term in ["serves_meat", "meat", "בשר"])
+        serves_meat = not _MEAT_TERMS.isdisjoint(attr_set)
     
-    # Check for gas usage in attributes (from features.json)
-    if not uses_gas:
-        uses_gas = "גז" in attrs
+    # Check for gas usage in attributes (from features.json); an explicit
+    # False flag is still overridden by a גז attribute
+    if not uses_gas and answers.get("uses_gas") is not None:
+        uses_gas = "גז" in attr_set
 
     return {
         "size_m2": size,
         "seats": seats,
-        "attributes": list(attrs),  # Ensure it's a list for JSON serialization
-        "uses_gas": bool(uses_gas) if uses_gas is not None else False,
-        "serves_meat": bool(serves_meat) if serves_meat is not None else False,
+        "attributes": attrs,  # Already a fresh list (JSON-serializable)
+        "uses_gas": bool(uses_gas),
+        "serves_meat": bool(serves_meat),
     }
 
+# Same digit class as the \d in the patterns below
+_DIGIT_RE = re.compile(r'\d')
+
+def _compile_patterns(patterns: List[Tuple[str, str]]) -> Tuple[Tuple[re.Pattern, str], ...]:
+    """Compile (pattern, constraint_type) pairs once at import time."""
+    return tuple((re.compile(pattern, re.IGNORECASE | re.UNICODE), constraint_type) for pattern, constraint_type in patterns)
+
+# Hebrew patterns for size (מ"ר, מטר מרובע)
+_SIZE_PATTERNS = _compile_patterns([
+    # Exact ranges: "100-200 מ"ר", "בין 50 ל-100 מ"ר"
+    (r'בין\s+(\d+)\s+ל[־\-]?(\d+)\s*(?:מ["\u05f4׳]?ר|מטר)', 'range'),
+    (r'(\d+)[־\-–—](\d+)\s*(?:מ["\u05f4׳]?ר|מטר)', 'range'),
+    
+    # Minimum thresholds: "מעל 100 מ"ר", "יותר מ-50 מ"ר", "לפחות 200 מ"ר"
+    (r'(?:מעל|יותר\s*מ[־\-]?|לפחות|החל\s*מ[־\-]?)\s*(\d+)\s*(?:מ["\u05f4׳]?ר|מטר)', 'min'),
+    
+    # Maximum thresholds: "עד 100 מ"ר", "לא יעלה על 150 מ"ר", "פחות מ-80 מ"ר"  
+    (r'(?:עד|לא\s*יעלה\s*על|פחות\s*מ[־\-]?|לא\s*יותר\s*מ[־\-]?)\s*(\d+)\s*(?:מ["\u05f4׳]?ר|מטר)', 'max'),
+    
+    # Exact values: "120 מ"ר", "גודלו 200 מ"ר" (only if no other constraint words)
+    (r'(?:^|[^א-ת])(\d+)\s*(?:מ["\u05f4׳]?ר|מטר)(?![א-ת])', 'exact'),
+])
+
+# Hebrew patterns for occupancy (איש, מקומות, תפוסה)
+_OCCUPANCY_PATTERNS = _compile_patterns([
+    # Exact ranges: "30-50 איש", "בין 20 ל-40 מקומות"
+    (r'בין\s+(\d+)\s+ל[־\-]?(\d+)\s*(?:איש|אנשים|מקומות?)', 'range'),
+    (r'(\d+)[־\-–—](\d+)\s*(?:איש|אנשים|מקומות?)', 'range'),
+    
+    # Minimum thresholds: "מעל 30 איש", "יותר מ-50 מקומות"
+    (r'(?:מעל|יותר\s*מ[־\-]?|לפחות|החל\s*מ[־\-]?)\s*(\d+)\s*(?:איש|אנשים|מקומות?)', 'min'),
+    
+    # Maximum thresholds: "עד 100 איש", "לא יותר מ-50 מקומות"
+    (r'(?:עד|לא\s*יעלה\s*על|פחות\s*מ[־\-]?|לא\s*יותר\s*מ[־\-]?)\s*(\d+)\s*(?:איש|אנשים|מקומות?)', 'max'),
+    
+    # Exact values: "50 איש", "תפוסה של 100 מקומות" (context-dependent)
+    (r'(?:תפוסה\s*של\s*|מיועד\s*ל[־\-]?)\s*(\d+)\s*(?:איש|אנשים|מקומות?)', 'exact'),
+])
+
+# Unit tokens the patterns above end with; a pattern group can only match
+# when one of its tokens occurs (מ["\u05f4׳]?ר|מטר and איש|אנשים|מקומות?)
+_SIZE_UNITS = ('מטר', 'מר', 'מ"ר', 'מ\u05f4ר', 'מ׳ר')
+_OCCUPANCY_UNITS = ('איש', 'אנשים', 'מקומו')
+
+@lru_cache(maxsize=4096)
 def _extract_numeric_ranges(text: str) -> dict:
     """
     Extract numeric ranges and thresholds from Hebrew regulatory text.
     
     Returns structured information about size and occupancy requirements.
+    Results are cached per text (paragraphs are static), so callers must
+    treat the returned dict as read-only.
     """
     if not text:
         return {}
@@ -66,44 +121,14 @@ def _extract_numeric_ranges(text: str) -> dict:
         'occupancy': {'min': None, 'max': None, 'exact': []}
     }
     
-    
-    # Hebrew patterns for size (מ"ר, מטר מרובע)
-    # Using named groups to identify constraint types
-    size_patterns = [
-        # Exact ranges: "100-200 מ"ר", "בין 50 ל-100 מ"ר"
-        (r'בין\s+(\d+)\s+ל[־\-]?(\d+)\s*(?:מ["\u05f4׳]?ר|מטר)', 'range'),
-        (r'(\d+)[־\-–—](\d+)\s*(?:מ["\u05f4׳]?ר|מטר)', 'range'),
-        
-        # Minimum thresholds: "מעל 100 מ"ר", "יותר מ-50 מ"ר", "לפחות 200 מ"ר"
-        (r'(?:מעל|יותר\s*מ[־\-]?|לפחות|החל\s*מ[־\-]?)\s*(\d+)\s*(?:מ["\u05f4׳]?ר|מטר)', 'min'),
-        
-        # Maximum thresholds: "עד 100 מ"ר", "לא יעלה על 150 מ"ר", "פחות מ-80 מ"ר"  
-        (r'(?:עד|לא\s*יעלה\s*על|פחות\s*מ[־\-]?|לא\s*יותר\s*מ[־\-]?)\s*(\d+)\s*(?:מ["\u05f4׳]?ר|מטר)', 'max'),
-        
-        # Exact values: "120 מ"ר", "גודלו 200 מ"ר" (only if no other constraint words)
-        (r'(?:^|[^א-ת])(\d+)\s*(?:מ["\u05f4׳]?ר|מטר)(?![א-ת])', 'exact'),
-    ]
-    
-    # Hebrew patterns for occupancy (איש, מקומות, תפוסה)
-    # Using named groups to identify constraint types
-    occupancy_patterns = [
-        # Exact ranges: "30-50 איש", "בין 20 ל-40 מקומות"
-        (r'בין\s+(\d+)\s+ל[־\-]?(\d+)\s*(?:איש|אנשים|מקומות?)', 'range'),
-        (r'(\d+)[־\-–—](\d+)\s*(?:איש|אנשים|מקומות?)', 'range'),
-        
-        # Minimum thresholds: "מעל 30 איש", "יותר מ-50 מקומות"
-        (r'(?:מעל|יותר\s*מ[־\-]?|לפחות|החל\s*מ[־\-]?)\s*(\d+)\s*(?:איש|אנשים|מקומות?)', 'min'),
-        
-        # Maximum thresholds: "עד 100 איש", "לא יותר מ-50 מקומות"
-        (r'(?:עד|לא\s*יעלה\s*על|פחות\s*מ[־\-]?|לא\s*יותר\s*מ[־\-]?)\s*(\d+)\s*(?:איש|אנשים|מקומות?)', 'max'),
-        
-        # Exact values: "50 איש", "תפוסה של 100 מקומות" (context-dependent)
-        (r'(?:תפוסה\s*של\s*|מיועד\s*ל[־\-]?)\s*(\d+)\s*(?:איש|אנשים|מקומות?)', 'exact'),
-    ]
+    # Every pattern needs a number; skip the regex battery for digit-free text
+    if not _DIGIT_RE.search(text):
+        return ranges
     
     # Extract size ranges with constraint type awareness
+    size_patterns = _SIZE_PATTERNS if any(unit in text for unit in _SIZE_UNITS) else ()
     for pattern, constraint_type in size_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE | re.UNICODE)
+        matches = pattern.findall(text)
         for match in matches:
             try:
                 if constraint_type == 'range' and isinstance(match, tuple) and len(match) == 2:
@@ -123,8 +148,9 @@ def _extract_numeric_ranges(text: str) -> dict:
                 continue
     
     # Extract occupancy ranges with constraint type awareness
+    occupancy_patterns = _OCCUPANCY_PATTERNS if any(unit in text for unit in _OCCUPANCY_UNITS) else ()
     for pattern, constraint_type in occupancy_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE | re.UNICODE)
+        matches = pattern.findall(text)
         for match in matches:
             try:
                 if constraint_type == 'range' and isinstance(match, tuple) and len(match) == 2:
@@ -150,6 +176,26 @@ def _extract_numeric_ranges(text: str) -> dict:
     return ranges
 
 
+# Bounds of a range with no numeric constraints
+_UNBOUNDED = (-math.inf, math.inf, False)
+
+def _range_bounds(reqs: Optional[dict]) -> Tuple[float, float, bool]:
+    """
+    Turn an extracted range into (lower, upper, constrained).
+    
+    Missing bounds become -inf/inf so a single chained comparison checks
+    both; constrained is True when the paragraph states any size/occupancy
+    figure (a non-zero min/max or an exact value).
+    """
+    if not reqs:
+        return _UNBOUNDED
+    lower, upper = reqs.get('min'), reqs.get('max')
+    return (
+        -math.inf if lower is None else lower,
+        math.inf if upper is None else upper,
+        bool(lower or upper or reqs.get('exact'))
+    )
+
 def _matches_numeric_requirements(user_profile: Dict[str, Any], paragraph_ranges: dict) -> bool:
     """
     Check if user's business characteristics match the numeric requirements in paragraph.
@@ -161,33 +207,33 @@ def _matches_numeric_requirements(user_profile: Dict[str, Any], paragraph_ranges
     Returns:
         True if user meets the numeric requirements, False otherwise
     """
-    user_size = user_profile.get("size_m2") or 0
-    user_seats = user_profile.get("seats") or 0
-    
-    # Check size requirements
-    size_reqs = paragraph_ranges.get('size_m2', {})
-    if size_reqs.get('min') is not None and user_size < size_reqs['min']:
-        return False
-    if size_reqs.get('max') is not None and user_size > size_reqs['max']:
-        return False
-    
-    # Check occupancy requirements  
-    occupancy_reqs = paragraph_ranges.get('occupancy', {})
-    if occupancy_reqs.get('min') is not None and user_seats < occupancy_reqs['min']:
-        return False
-    if occupancy_reqs.get('max') is not None and user_seats > occupancy_reqs['max']:
-        return False
-    
-    # If paragraph has specific size/occupancy requirements but user doesn't match any
-    has_size_reqs = size_reqs.get('min') or size_reqs.get('max') or size_reqs.get('exact')
-    has_occupancy_reqs = occupancy_reqs.get('min') or occupancy_reqs.get('max') or occupancy_reqs.get('exact')
-    
-    if has_size_reqs and user_size == 0:
-        return False  # Can't match size requirements without size info
-    if has_occupancy_reqs and user_seats == 0:
-        return False  # Can't match occupancy requirements without occupancy info
-    
-    return True
+    return _within_bounds(
+        _range_bounds(paragraph_ranges.get('size_m2')),
+        _range_bounds(paragraph_ranges.get('occupancy')),
+        user_profile.get("size_m2") or 0,
+        user_profile.get("seats") or 0
+    )
+
+@lru_cache(maxsize=4096)
+def _paragraph_bounds(text: str) -> Tuple[Tuple[float, float, bool], Tuple[float, float, bool]]:
+    """Size and occupancy bounds of a paragraph, derived once per text."""
+    paragraph_ranges = _extract_numeric_ranges(text)
+    return _range_bounds(paragraph_ranges.get('size_m2')), _range_bounds(paragraph_ranges.get('occupancy'))
+
+def _within_bounds(size_bounds: Tuple[float, float, bool], occupancy_bounds: Tuple[float, float, bool],
+                   user_size: float, user_seats: float) -> bool:
+    """Numeric filter shared by single checks and the match_requirements loop."""
+    size_min, size_max, has_size_reqs = size_bounds
+    occupancy_min, occupancy_max, has_occupancy_reqs = occupancy_bounds
+    
+    # Within both ranges, and not missing info a stated requirement needs
+    # (can't match size/occupancy requirements without size/occupancy info)
+    return (
+        size_min <= user_size <= size_max
+        and occupancy_min <= user_seats <= occupancy_max
+        and not (has_size_reqs and user_size == 0)
+        and not (has_occupancy_reqs and user_seats == 0)
+    )
 
 
 
@@ -197,8 +243,7 @@ def _load_features_from_json():
     """Load features from features.json file for dynamic matching."""
     try:
         features_path = Path(__file__).resolve().parents[1] / "data" / "raw" / "features.json"
-        with features_path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json(features_path)
     except Exception as e:
         logger.warning(f"Could not load features.json: {e}")
         return {}
@@ -255,6 +300,31 @@ def _matches_user_profile(user_profile: Dict[str, Any], feature: str) -> bool:
     # Default: apply feature unless explicitly excluded
     return True
 
+def _terms_pattern(terms: List[str]) -> re.Pattern:
+    """Compile a list of literal terms into a single alternation (one pass per text)."""
+    return re.compile("|".join(map(re.escape, terms)))
+
+# High-priority safety terms that boost relevance
+_HIGH_PRIORITY_TERMS_RE = _terms_pattern(["חירום", "בטיחות", "כיבוי", "emergency", "safety", "fire", "מתזים", "גלאי"])
+
+# Safety terms that make a matched requirement high priority
+_SAFETY_TERMS_RE = _terms_pattern(["חירום", "בטיחות", "כיבוי", "emergency", "safety"])
+
+@lru_cache(maxsize=4096)
+def _paragraph_terms(text: str) -> Tuple[bool, bool, bool]:
+    """
+    User-independent term flags of a paragraph, derived once per text.
+    
+    Returns:
+        Tuple of (has_high_priority_terms, has_safety_terms, mentions_meat)
+    """
+    text_lower = text.lower()
+    return (
+        _HIGH_PRIORITY_TERMS_RE.search(text_lower) is not None,
+        _SAFETY_TERMS_RE.search(text_lower) is not None,
+        "בשר" in text or "meat" in text_lower or "כשר" in text
+    )
+
 def _assess_requirement_relevance(paragraph_text: str, user_profile: Dict[str, Any], paragraph_ranges: dict = None) -> float:
     """
     Assess how relevant a requirement paragraph is to the user's business.
@@ -277,7 +347,7 @@ def _assess_requirement_relevance(paragraph_text: str, user_profile: Dict[str, A
     if paragraph_ranges is None:
         paragraph_ranges = _extract_numeric_ranges(paragraph_text)
         
-    text_lower = paragraph_text.lower()
+    has_high_priority_terms, _, mentions_meat = _paragraph_terms(paragraph_text)
     user_size = user_profile.get("size_m2") or 0
     user_seats = user_profile.get("seats") or 0
     
@@ -328,9 +398,10 @@ def _assess_requirement_relevance(paragraph_text: str, user_profile: Dict[str, A
     attributes = user_profile.get("attributes", [])
     features_data = _load_features_from_json()
     
-    # Check each dynamic feature from features.json
+    # Check each dynamic feature from features.json (hashed attribute lookups)
+    attr_set = frozenset(attributes)
     for feature_key, feature_data in features_data.items():
-        if feature_key in attributes:
+        if feature_key in attr_set:
             # Check if this feature is mentioned in the paragraph text
             keywords = feature_data.get("keywords", [])
             if isinstance(keywords, list):
@@ -345,12 +416,11 @@ def _assess_requirement_relevance(paragraph_text: str, user_profile: Dict[str, A
                             break
     
     # Meat-serving specific relevance (legacy)
-    if user_profile.get("serves_meat") and ("בשר" in paragraph_text or "meat" in text_lower or "כשר" in paragraph_text):
+    if user_profile.get("serves_meat") and mentions_meat:
         relevance_score += 0.1
         
     # High-priority safety terms (always boost relevance)
-    high_priority_terms = ["חירום", "בטיחות", "כיבוי", "emergency", "safety", "fire", "מתזים", "גלאי"]
-    if any(term in text_lower for term in high_priority_terms):
+    if has_high_priority_terms:
         relevance_score += 0.3
     
     # Penalty for requirements that clearly don't match user's business size/occupancy
@@ -359,6 +429,27 @@ def _assess_requirement_relevance(paragraph_text: str, user_profile: Dict[str, A
     
     return min(relevance_score, 1.0)
 
+def _requirement_priority(text: str, relevance: float) -> str:
+    """Assign priority based on relevance score and safety keywords."""
+    if relevance >= 0.8 or _paragraph_terms(text)[1]:
+        return "high"
+    if relevance >= 0.5:
+        return "medium"
+    return "low"
+
+def _business_profile(user_profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Classify the business by size and occupancy for the report summary."""
+    return {
+        "size_category": "small" if user_profile.get("size_m2", 0) < 100 else "large",
+        "occupancy_category": "low" if user_profile.get("seats", 0) < 50 else "high",
+        "special_requirements": user_profile.get("uses_gas", False) or user_profile.get("serves_meat", False)
+    }
+
+def _applicable_features(user_profile: Dict[str, Any], mappings: Dict[str, Any]) -> List[str]:
+    """Features from the mappings that apply to an already normalized profile."""
+    # Sort for consistent ordering
+    return sorted(feature_name for feature_name in mappings if _matches_user_profile(user_profile, feature_name))
+
 # ---------- Public API ----------
 
 def get_applicable_features(user_answers: Dict[str, Any]) -> List[str]:
@@ -376,16 +467,7 @@ def get_applicable_features(user_answers: Dict[str, Any]) -> List[str]:
     Returns:
         List of applicable feature names
     """
-    user_profile = _normalize_user_input(user_answers)
-    mappings = get_mappings()
-    
-    applicable_features = []
-    for feature_name in mappings.keys():
-        if _matches_user_profile(user_profile, feature_name):
-            applicable_features.append(feature_name)
-    
-    # Sort for consistent ordering
-    return sorted(applicable_features)
+    return _applicable_features(_normalize_user_input(user_answers), get_mappings())
 
 def match_requirements(user_answers: Dict[str, Any], min_relevance: float = 0.3) -> Dict[str, Any]:
     """
@@ -415,13 +497,24 @@ def match_requirements(user_answers: Dict[str, Any], min_relevance: float = 0.3)
     paragraphs = get_paragraphs()
     mappings = get_mappings()
     
-    # Get applicable features
-    applicable_features = get_applicable_features(user_answers)
+    # Get applicable features (reusing the profile and mappings loaded above)
+    applicable_features = _applicable_features(user_profile, mappings)
     
     # Collect matching paragraphs
     matched_paragraphs = []
     by_category = {}
     
+    # Per-user values for the numeric filter, looked up once
+    user_size = user_profile.get("size_m2") or 0
+    user_seats = user_profile.get("seats") or 0
+    
+    # The same paragraph can be mapped from several features/categories;
+    # its relevance and priority for this user only need to be computed once
+    scored_by_text = {}
+    text_by_ref = {}
+    priority_counts = {"high": 0, "medium": 0, "low": 0}
+    relevance_total = 0.0
+    
     for feature_name in applicable_features:
         if feature_name not in mappings:
             continue
@@ -434,21 +527,28 @@ def match_requirements(user_answers: Dict[str, Any], min_relevance: float = 0.3)
                 by_category[category] = []
                 
             for paragraph_num in paragraph_numbers:
-                # Get paragraph text
-                text = get_paragraph_text(paragraphs, category, paragraph_num)
+                # Get paragraph text (walked once per (category, number) reference)
+                ref = (category, paragraph_num)
+                text = text_by_ref.get(ref)
+                if text is None:
+                    text = text_by_ref[ref] = get_paragraph_text(paragraphs, category, paragraph_num)
                 if not text:
                     continue
                 
-                # Extract numeric ranges from paragraph
-                paragraph_ranges = _extract_numeric_ranges(text)
-                
                 # First check if user matches the numeric requirements
-                if not _matches_numeric_requirements(user_profile, paragraph_ranges):
+                if not _within_bounds(*_paragraph_bounds(text), user_size, user_seats):
                     # Skip requirements that don't match user's size/occupancy constraints
                     continue
                 
+                # Extract numeric ranges from paragraph
+                paragraph_ranges = _extract_numeric_ranges(text)
+                
                 # Assess relevance with range information
-                relevance = _assess_requirement_relevance(text, user_profile, paragraph_ranges)
+                scored = scored_by_text.get(text)
+                if scored is None:
+                    relevance = _assess_requirement_relevance(text, user_profile, paragraph_ranges)
+                    scored = scored_by_text[text] = (relevance, _requirement_priority(text, relevance))
+                relevance, priority = scored
                 if relevance < min_relevance:
                     continue
                 
@@ -459,34 +559,27 @@ def match_requirements(user_answers: Dict[str, Any], min_relevance: float = 0.3)
                     "relevance_score": relevance,
                     "matched_features": [feature_name],
                     "source": "feature_mapping",
-                    "numeric_ranges": paragraph_ranges
+                    # Copy: paragraph_ranges is the shared cached dict
+                    "numeric_ranges": {
+                        key: {**bounds, "exact": list(bounds["exact"])}
+                        for key, bounds in paragraph_ranges.items()
+                    },
+                    "priority": priority
                 }
                 
                 matched_paragraphs.append(requirement)
                 by_category[category].append(requirement)
+                
+                # Summary statistics are accumulated as requirements are matched
+                priority_counts[priority] += 1
+                relevance_total += relevance
     
     # Sort by relevance score (descending)
-    matched_paragraphs.sort(key=lambda x: x["relevance_score"], reverse=True)
+    matched_paragraphs.sort(key=itemgetter("relevance_score"), reverse=True)
     
     # Sort within categories
     for category in by_category:
-        by_category[category].sort(key=lambda x: (x["relevance_score"], x["paragraph_number"]), reverse=True)
-    
-    # Calculate summary statistics and assign priorities
-    priority_counts = {"high": 0, "medium": 0, "low": 0}
-    for req in matched_paragraphs:
-        # Assign priority based on relevance score and safety keywords
-        text_lower = req["text"].lower()
-        if (req["relevance_score"] >= 0.8 or 
-            any(term in text_lower for term in ["חירום", "בטיחות", "כיבוי", "emergency", "safety"])):
-            req["priority"] = "high"
-            priority_counts["high"] += 1
-        elif req["relevance_score"] >= 0.5:
-            req["priority"] = "medium"
-            priority_counts["medium"] += 1 
-        else:
-            req["priority"] = "low"
-            priority_counts["low"] += 1
+        by_category[category].sort(key=itemgetter("relevance_score", "paragraph_number"), reverse=True)
     
     return {
         "matched_requirements": matched_paragraphs,
@@ -497,11 +590,7 @@ def match_requirements(user_answers: Dict[str, Any], min_relevance: float = 0.3)
         "summary": {
             "categories_count": len(by_category),
             "priority_breakdown": priority_counts,
-            "avg_relevance": sum(r["relevance_score"] for r in matched_paragraphs) / len(matched_paragraphs) if matched_paragraphs else 0,
-            "business_profile": {
-                "size_category": "small" if user_profile.get("size_m2", 0) < 100 else "large",
-                "occupancy_category": "low" if user_profile.get("seats", 0) < 50 else "high",
-                "special_requirements": user_profile.get("uses_gas", False) or user_profile.get("serves_meat", False)
-            }
+            "avg_relevance": relevance_total / len(matched_paragraphs) if matched_paragraphs else 0,
+            "business_profile": _business_profile(user_profile)
         }
     }
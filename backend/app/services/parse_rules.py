@@ -172,6 +172,18 @@ def canonicalize_num(raw_num: str, current_chapter: Optional[str]) -> str:
 RE_CATEGORY = re.compile(r'^\s*פרק\s+(\d+)\s*(?:[-–—]\s*(.+?))?\s*$', re.U)  # Chapter headers
 RE_NUM_START = re.compile(r'^\s*(\d+(?:\.\d+){0,19})(?=[\s\.\-\)])', re.U)  # Paragraph numbers
 
+# Both anchors above combined into one scan over the whole document. Matching starts
+# at a literal "\n" (the text is scanned with a leading "\n") so the regex engine can
+# jump between line starts instead of trying every position. Within-line whitespace
+# is [^\S\n]; a number must be followed by [.-)] or by whitespace and more text.
+RE_ANCHORS = re.compile(
+    r'\n[^\S\n]*(?:'
+    r'פרק[^\S\n]+(?P<chapter>\d+)[^\S\n]*(?:[-–—][^\S\n]*(?P<title>\S.*?))?[^\S\n]*$'
+    r'|(?P<num>\d+(?:\.\d+){0,19})(?=[\.\-\)]|[^\S\n]+\S)'
+    r')',
+    re.M | re.U,
+)
+
 
 def ensure_node(tree: Dict, cat: str, num: str) -> Dict:
     """Ensure hierarchical node exists in tree."""
@@ -181,7 +193,8 @@ def ensure_node(tree: Dict, cat: str, num: str) -> Dict:
     path = []
     for part in num.split("."):
         path.append(part)
-        key = ".".join(path)
+        # Interned keys are shared across nodes and compare by identity on lookup
+        key = sys.intern(".".join(path))
         if key not in cur:
             cur[key] = {"text": ""}
         cur = cur[key]
@@ -223,36 +236,36 @@ def parse_paragraphs(text: str) -> Dict[str, Any]:
     current_chapter: Optional[str] = None   # e.g., "4"
     current_num: Optional[str] = None
 
-    # normalize lines: keep only non-empty
-    lines = [ln.strip() for ln in text.split("\n") if ln.strip()]
+    # Locate all chapter/number anchors in one pass; text between consecutive
+    # anchors is the body of the preceding one. Text before the first anchor is ignored.
+    text = "\n" + text
+    anchors = list(RE_ANCHORS.finditer(text))
+    for i, m in enumerate(anchors):
+        seg_end = anchors[i + 1].start() if i + 1 < len(anchors) else len(text)
 
-    for ln in lines:
         # 1) explicit chapter header: "פרק 4 - משרד הבריאות"
-        m_cat = RE_CATEGORY.match(ln)
-        if m_cat:
-            current_chapter = m_cat.group(1)         # "4"
-            current_cat = (m_cat.group(2) or f"פרק {current_chapter}").strip()
+        if m.group("chapter"):
+            current_chapter = sys.intern(m.group("chapter"))   # "4"
+            current_cat = (m.group("title") or f"פרק {current_chapter}").strip()
             ensure_node(paragraphs, current_cat, current_chapter)
             current_num = current_chapter
-            continue
-
+            body_start = m.end()                     # header line itself is not content
         # 2) heading number at start
-        m_start = RE_NUM_START.match(ln)
-        if m_start:
-            raw = m_start.group(1)                   # e.g., "1.1" or "4.6.3"
-            num = canonicalize_num(raw, current_chapter)
+        else:
+            raw = m.group("num")                     # e.g., "1.1" or "4.6.3"
+            num = sys.intern(canonicalize_num(raw, current_chapter))
             if current_cat is None:
                 # fallback if file starts without "פרק ..."
                 current_cat = f"פרק {chapter_of(num)}"
-                current_chapter = chapter_of(num)
+                current_chapter = sys.intern(chapter_of(num))
                 ensure_node(paragraphs, current_cat, current_chapter)
             current_num = num
-            add_text(paragraphs, current_cat, current_num, ln)
-            continue
+            body_start = m.start()                   # numbered line is part of the content
 
-        # 3) plain text → append to current paragraph
-        if current_cat and current_num:
-            add_text(paragraphs, current_cat, current_num, ln)
+        # 3) following plain lines → joined into the current paragraph
+        body = " ".join(filter(None, map(str.strip, text[body_start:seg_end].split("\n"))))
+        if body:
+            add_text(paragraphs, current_cat, current_num, body)
 
     return paragraphs
 
@@ -371,6 +384,9 @@ def load_features_json(path: Path) -> Dict[str, Any]:
 # -------------------------
 
 
+_END = object()  # Sentinel for exhausted key iterators
+
+
 def _norm_text_compare(s: str) -> str:
     return " ".join((s or "").split())
 
@@ -597,24 +613,28 @@ def compare_outputs(par_a: Dict[str, Any], map_a: Dict[str, Any], par_b: Dict[st
             return False, f"Paragraph numbers differ in category '{cat}'. missing_in_A={miss_a} missing_in_B={miss_b}"
 
     # Compare text contents with whitespace normalization
+    # Iterative depth-first walk (sorted keys, same order as a recursive walk);
+    # each stack frame holds a key iterator so no per-node copies or recursion are needed
     def walk_pairs(n1: Any, n2: Any, path: str) -> Tuple[bool, str]:
-        if isinstance(n1, dict) and isinstance(n2, dict):
-            keys = set(n1.keys()) | set(n2.keys())
-            for k in sorted(keys):
-                if k not in n1 or k not in n2:
-                    return False, f"Key mismatch at {path}: {k}"
-                if k == "text":
-                    t1 = _norm_text_compare(n1.get("text", ""))
-                    t2 = _norm_text_compare(n2.get("text", ""))
-                    if t1 != t2:
-                        return False, f"Text differs at {path}."
-                else:
-                    ok, msg = walk_pairs(n1[k], n2[k], path + f"/{k}")
-                    if not ok:
-                        return ok, msg
-            return True, ""
-        else:
+        if not (isinstance(n1, dict) and isinstance(n2, dict)):
             return True, ""
+        stack = [(iter(sorted(n1.keys() | n2.keys())), n1, n2, path)]
+        while stack:
+            keys, a, b, cur_path = stack[-1]
+            k = next(keys, _END)
+            if k is _END:
+                stack.pop()
+                continue
+            if k not in a or k not in b:
+                return False, f"Key mismatch at {cur_path}: {k}"
+            if k == "text":
+                t1 = _norm_text_compare(a.get("text", ""))
+                t2 = _norm_text_compare(b.get("text", ""))
+                if t1 != t2:
+                    return False, f"Text differs at {cur_path}."
+            elif isinstance(a[k], dict) and isinstance(b[k], dict):
+                stack.append((iter(sorted(a[k].keys() | b[k].keys())), a[k], b[k], cur_path + f"/{k}"))
+        return True, ""
 
     ok, msg = walk_pairs(par_a, par_b, "paragraphs")
     if not ok:
@@ -1,34 +1,108 @@
 import json
-from functools import lru_cache
+import sys
+import threading
 from pathlib import Path
 from typing import Dict, Any, Tuple
 
+try:
+    import orjson  # Optional: faster parsing of the processed JSON files
+except ImportError:
+    orjson = None
+
+
+# Processed parser outputs served by the API
+DATA_DIR = Path(__file__).resolve().parents[1] / "data" / "processed"
+
+# Module-level cache: {"entry": ((paragraphs_ns, mappings_ns), (paragraphs, mappings))}.
+# The key and data live in one tuple so a lock-free reader sees both or neither.
+_CACHE: Dict[str, Any] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _data_mtime(paragraphs_path: Path, mappings_path: Path) -> Tuple[int, int]:
+    """Return modification times (ns) of both data files as the cache key."""
+    return paragraphs_path.stat().st_mtime_ns, mappings_path.stat().st_mtime_ns
+
+
+def load_json(path: Path) -> Any:
+    """
+    Parse a JSON file from raw bytes, preferring orjson when installed.
+    
+    Shared by the data loaders here and the matching service's
+    features.json lookup.
+    """
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _intern_mappings(mappings: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Intern feature and category names so the Hebrew keys shared between
+    mappings.json and paragraphs.json compare by identity in dict lookups.
+    """
+    interned = {}
+    for feature, mapping in mappings.items():
+        categories = mapping.get("categories") if isinstance(mapping, dict) else None
+        if isinstance(categories, dict):
+            mapping = {**mapping, "categories": {sys.intern(c): nums for c, nums in categories.items()}}
+        interned[sys.intern(feature)] = mapping
+    return interned
+
 
-@lru_cache(maxsize=1)
 def load_parser_data() -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
     Load processed parser outputs for regulatory requirements matching.
     
-    Uses the Singleton pattern with LRU cache for efficient memory usage.
+    Uses the Singleton pattern with an mtime-validated module cache: the JSON
+    files are parsed once and re-read only when either file changes on disk,
+    so long-running workers pick up regenerated data without a restart.
+    Category and feature names are interned once per load when parsing
+    with the stdlib json fallback.
     
     Returns:
         Tuple of (paragraphs, mappings) where:
         - paragraphs: Hierarchical document structure by category
         - mappings: Feature-to-paragraph mappings for content classification
     """
-    base = Path(__file__).resolve().parents[1]
+    paragraphs_path = DATA_DIR / "paragraphs.json"
+    mappings_path = DATA_DIR / "mappings.json"
     
-    # Load hierarchical document structure
-    paragraphs_path = base / "data" / "processed" / "paragraphs.json"
-    with paragraphs_path.open("r", encoding="utf-8") as f:
-        paragraphs = json.load(f)
+    # Fast path: a stat() per call, no JSON parsing
+    mtime = _data_mtime(paragraphs_path, mappings_path)
+    entry = _CACHE.get("entry")
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
     
-    # Load feature mappings
-    mappings_path = base / "data" / "processed" / "mappings.json"
-    with mappings_path.open("r", encoding="utf-8") as f:
-        mappings = json.load(f)
+    # Slow path: only one thread pays the parse cost
+    with _CACHE_LOCK:
+        entry = _CACHE.get("entry")
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+        
+        # Load hierarchical document structure
+        paragraphs = load_json(paragraphs_path)
+        
+        # Load feature mappings
+        mappings = load_json(mappings_path)
+        
+        # orjson already shares key objects through its key cache; the
+        # stdlib parser creates a new string per occurrence
+        if orjson is None:
+            paragraphs = {sys.intern(c): v for c, v in paragraphs.items()}
+            mappings = _intern_mappings(mappings)
+        
+        data = (paragraphs, mappings)
+        _CACHE["entry"] = (mtime, data)
     
-    return paragraphs, mappings
+    return data
+
+
+def clear_cache() -> None:
+    """Drop cached parser data so the next call reloads from disk."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
 
 
 def get_paragraphs() -> Dict[str, Any]:
@@ -7,80 +7,86 @@ for all backend unit tests.
 
 import pytest
 import os
+import re
 import sys
-import tempfile
+import functools
+from pathlib import Path
+from types import MappingProxyType, ModuleType, SimpleNamespace
 from unittest.mock import Mock, patch
 from flask import Flask
 
-# Add the backend directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-# Mock external dependencies before importing app
-with patch.dict('sys.modules', {
-    'flask_cors': Mock(),
-    'openai': Mock(),
-    'anthropic': Mock(),
-}):
-    from app import create_app
-
-
-@pytest.fixture(scope="session")
-def app():
-    """Create test Flask application."""
-    # Create temporary directory for test data
-    test_dir = tempfile.mkdtemp()
-    
-    # Set test environment variables
-    test_env = {
-        'FLASK_ENV': 'testing',
-        'TESTING': 'True',
-        'OPENAI_API_KEY': 'test-key-for-testing',
-        'AI_MAX_TOKENS': '1000',
-        'AI_TEMPERATURE': '0.5'
-    }
-    
-    # Mock external dependencies
-    with patch.dict('sys.modules', {
-        'flask_cors': Mock(),
-        'openai': Mock(),
-        'anthropic': Mock(),
-    }):
-        with patch.dict(os.environ, test_env):
-            app = create_app()
-            app.config.update({
-                'TESTING': True,
-                'WTF_CSRF_ENABLED': False,
-            })
-            yield app
-
-
-@pytest.fixture
-def client(app):
-    """Create test client."""
-    return app.test_client()
-
-
-@pytest.fixture
-def runner(app):
-    """Create test CLI runner."""
-    return app.test_cli_runner()
-
-
-@pytest.fixture
-def sample_business_data():
-    """Sample business data for testing."""
-    return {
-        "size_m2": 150,
-        "seats": 50,
-        "attributes": ["גז", "בשר", "מצלמות אבטחה"],
-        "matched_requirements": [
+# Add the backend directory to Python path (once, for every test module)
+_BACKEND_DIR = str(Path(__file__).resolve().parent.parent)
+if _BACKEND_DIR not in sys.path:
+    sys.path.insert(0, _BACKEND_DIR)
+
+# Stub external dependencies once, before any test module imports app.
+# Stubs are plain modules, so only the names the app imports exist on them.
+_STUB_EXPORTS = {
+    'flask_cors': ('CORS',),
+    'openai': ('OpenAI',),
+    'anthropic': (),
+}
+for _name, _exports in _STUB_EXPORTS.items():
+    _stub = ModuleType(_name)
+    for _attr in _exports:
+        setattr(_stub, _attr, Mock())
+    sys.modules.setdefault(_name, _stub)
+
+from app import create_app
+from app.services.ai_service import AIService, AIProvider, AIResponse
+
+# Environment shared by the whole test session
+TEST_ENV = {
+    'FLASK_ENV': 'testing',
+    'TESTING': 'True',
+    'OPENAI_API_KEY': 'test-key-for-testing',
+    'AI_MAX_TOKENS': '1000',
+    'AI_TEMPERATURE': '0.5'
+}
+
+
+def _freeze(value):
+    """Return a read-only view of nested dict/list sample data."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Sample data shared (read-only) by the fixtures below
+_SAMPLE_BUSINESS_DATA = _freeze({
+    "size_m2": 150,
+    "seats": 50,
+    "attributes": ["גז", "בשר", "מצלמות אבטחה"],
+    "matched_requirements": [
+        {
+            "category": "בטיחות",
+            "paragraph_number": "1.1",
+            "text": "עסק המגיש בשר חייב להחזיק תעודת כשרות",
+            "priority": "high",
+            "relevance_score": 0.9
+        },
+        {
+            "category": "כיבוי אש",
+            "paragraph_number": "2.3",
+            "text": "עסק המשתמש בגז חייב להתקין גלאי גז",
+            "priority": "high",
+            "relevance_score": 0.8
+        }
+    ],
+    "by_category": {
+        "בטיחות": [
             {
                 "category": "בטיחות",
                 "paragraph_number": "1.1",
                 "text": "עסק המגיש בשר חייב להחזיק תעודת כשרות",
                 "priority": "high",
                 "relevance_score": 0.9
-            },
+            }
+        ],
+        "כיבוי אש": [
             {
                 "category": "כיבוי אש",
                 "paragraph_number": "2.3",
@@ -88,166 +94,229 @@ def sample_business_data():
                 "priority": "high",
                 "relevance_score": 0.8
             }
-        ],
-        "by_category": {
-            "בטיחות": [
-                {
-                    "category": "בטיחות",
-                    "paragraph_number": "1.1",
-                    "text": "עסק המגיש בשר חייב להחזיק תעודת כשרות",
-                    "priority": "high",
-                    "relevance_score": 0.9
-                }
-            ],
-            "כיבוי אש": [
-                {
-                    "category": "כיבוי אש",
-                    "paragraph_number": "2.3",
-                    "text": "עסק המשתמש בגז חייב להתקין גלאי גז",
-                    "priority": "high",
-                    "relevance_score": 0.8
-                }
-            ]
+        ]
+    },
+    "summary": {
+        "business_profile": {
+            "size_category": "large",
+            "occupancy_category": "high",
+            "special_requirements": True
         },
-        "summary": {
-            "business_profile": {
-                "size_category": "large",
-                "occupancy_category": "high",
-                "special_requirements": True
-            },
-            "priority_breakdown": {
-                "high": 2,
-                "medium": 0,
-                "low": 0
-            },
-            "avg_relevance": 0.85
-        }
+        "priority_breakdown": {
+            "high": 2,
+            "medium": 0,
+            "low": 0
+        },
+        "avg_relevance": 0.85
     }
+})
+
+_SAMPLE_USER_INPUT = _freeze({
+    "size_m2": 150,
+    "seats": 50,
+    "attributes": ["גז", "בשר"],
+    "uses_gas": True,
+    "serves_meat": True
+})
+
+_SAMPLE_QUESTIONS = _freeze([
+    {
+        "name": "size_m2",
+        "label": "גודל העסק (מ\"ר)",
+        "type": "number",
+        "required": True,
+        "min": 1,
+        "max": 10000,
+        "placeholder": "לדוגמה: 150",
+        "description": "שטח העסק במטרים מרובעים"
+    },
+    {
+        "name": "seats",
+        "label": "מספר מקומות ישיבה / תפוסה",
+        "type": "number",
+        "required": True,
+        "min": 0,
+        "max": 1000,
+        "placeholder": "לדוגמה: 50",
+        "description": "מספר לקוחות שיכולים לשבת במקום"
+    },
+    {
+        "name": "attributes",
+        "label": "מאפייני עסק נוספים",
+        "type": "multiselect",
+        "required": False,
+        "options": [
+            {"value": "גז", "label": "שימוש בגז"},
+            {"value": "בשר", "label": "הגשת בשר"},
+            {"value": "מצלמות אבטחה", "label": "מצלמות אבטחה"}
+        ],
+        "description": "בחר את כל המאפיינים הרלוונטיים"
+    }
+])
 
-
-@pytest.fixture
-def sample_user_input():
-    """Sample user input for testing."""
-    return {
+_SAMPLE_MATCHING_RESULT = _freeze({
+    "matched_requirements": [
+        {
+            "category": "בטיחות",
+            "paragraph_number": "1.1",
+            "text": "דרישת בטיחות חשובה",
+            "priority": "high",
+            "relevance_score": 0.9
+        }
+    ],
+    "by_category": {
+        "בטיחות": [
+            {
+                "category": "בטיחות",
+                "paragraph_number": "1.1",
+                "text": "דרישת בטיחות חשובה",
+                "priority": "high",
+                "relevance_score": 0.9
+            }
+        ]
+    },
+    "feature_coverage": ["מ\"ר", "תפוסה", "גז"],
+    "user_profile": {
         "size_m2": 150,
         "seats": 50,
-        "attributes": ["גז", "בשר"],
+        "attributes": ["גז"],
         "uses_gas": True,
-        "serves_meat": True
+        "serves_meat": False
+    },
+    "total_matches": 1,
+    "summary": {
+        "categories_count": 1,
+        "priority_breakdown": {
+            "high": 1,
+            "medium": 0,
+            "low": 0
+        },
+        "avg_relevance": 0.9,
+        "business_profile": {
+            "size_category": "large",
+            "occupancy_category": "high",
+            "special_requirements": True
+        }
     }
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _get_app():
+    """Build the test Flask application once per process."""
+    with patch.dict(os.environ, TEST_ENV):
+        app = create_app(testing=True)
+    app.config.update({
+        'WTF_CSRF_ENABLED': False,
+    })
+    return app
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Create test Flask application.
+    
+    Session scope is per process: under pytest-xdist each worker builds
+    its own app, so tests must not rely on state shared across workers.
+    """
+    yield _get_app()
+
+
+@pytest.fixture(scope="session")
+def _client(app):
+    """Create one test client for the whole session."""
+    return app.test_client()
 
 
 @pytest.fixture
-def sample_questions():
-    """Sample questions for testing."""
-    return [
-        {
-            "name": "size_m2",
-            "label": "גודל העסק (מ\"ר)",
-            "type": "number",
-            "required": True,
-            "min": 1,
-            "max": 10000,
-            "placeholder": "לדוגמה: 150",
-            "description": "שטח העסק במטרים מרובעים"
-        },
-        {
-            "name": "seats",
-            "label": "מספר מקומות ישיבה / תפוסה",
-            "type": "number",
-            "required": True,
-            "min": 0,
-            "max": 1000,
-            "placeholder": "לדוגמה: 50",
-            "description": "מספר לקוחות שיכולים לשבת במקום"
-        },
-        {
-            "name": "attributes",
-            "label": "מאפייני עסק נוספים",
-            "type": "multiselect",
-            "required": False,
-            "options": [
-                {"value": "גז", "label": "שימוש בגז"},
-                {"value": "בשר", "label": "הגשת בשר"},
-                {"value": "מצלמות אבטחה", "label": "מצלמות אבטחה"}
-            ],
-            "description": "בחר את כל המאפיינים הרלוונטיים"
-        }
-    ]
+def client(_client):
+    """Test client shared across tests (request state is reset per call)."""
+    return _client
 
 
 @pytest.fixture
+def runner(app):
+    """Create test CLI runner."""
+    return app.test_cli_runner()
+
+
+@pytest.fixture(scope="session")
+def sample_business_data():
+    """Sample business data for testing (read-only, shared per session)."""
+    return _SAMPLE_BUSINESS_DATA
+
+
+@pytest.fixture(scope="session")
+def sample_user_input():
+    """Sample user input for testing (read-only, shared per session)."""
+    return _SAMPLE_USER_INPUT
+
+
+@pytest.fixture(scope="session")
+def sample_questions():
+    """Sample questions for testing (read-only, shared per session)."""
+    return _SAMPLE_QUESTIONS
+
+
+@pytest.fixture(scope="session")
 def sample_matching_result():
-    """Sample matching result for testing."""
+    """Sample matching result for testing (read-only, shared per session)."""
+    return _SAMPLE_MATCHING_RESULT
+
+
+@pytest.fixture
+def match_result():
+    """Empty match_requirements() result for patched route tests (fresh per test).
+
+    Plain dicts rather than _freeze(): the routes jsonify parts of it, and
+    nested MappingProxyType/tuples are not serializable there.
+    """
     return {
-        "matched_requirements": [
-            {
-                "category": "בטיחות",
-                "paragraph_number": "1.1",
-                "text": "דרישת בטיחות חשובה",
-                "priority": "high",
-                "relevance_score": 0.9
-            }
-        ],
-        "by_category": {
-            "בטיחות": [
-                {
-                    "category": "בטיחות",
-                    "paragraph_number": "1.1",
-                    "text": "דרישת בטיחות חשובה",
-                    "priority": "high",
-                    "relevance_score": 0.9
-                }
-            ]
-        },
-        "feature_coverage": ["מ\"ר", "תפוסה", "גז"],
-        "user_profile": {
-            "size_m2": 150,
-            "seats": 50,
-            "attributes": ["גז"],
-            "uses_gas": True,
-            "serves_meat": False
-        },
-        "total_matches": 1,
+        "matched_requirements": [],
+        "by_category": {},
+        "feature_coverage": [],
+        "total_matches": 0,
+        "user_profile": {"size_m2": 150, "seats": 50},
         "summary": {
-            "categories_count": 1,
-            "priority_breakdown": {
-                "high": 1,
-                "medium": 0,
-                "low": 0
-            },
-            "avg_relevance": 0.9,
-            "business_profile": {
-                "size_category": "large",
-                "occupancy_category": "high",
-                "special_requirements": True
-            }
+            "business_profile": {"size_category": "large", "occupancy_category": "high", "special_requirements": False},
+            "priority_breakdown": {"high": 0, "medium": 0, "low": 0},
+            "avg_relevance": 0.5
         }
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def ai_service_instance():
+    """AIService shared across tests (patch strategies per test, not globally)."""
+    return AIService()
+
+
+@pytest.fixture(scope="session")
+def openai_strategy(ai_service_instance):
+    """OpenAI strategy of the shared AIService."""
+    return ai_service_instance.strategies[AIProvider.OPENAI]
+
+
+@pytest.fixture(scope="session")
 def mock_openai_response():
-    """Mock OpenAI API response."""
-    return Mock(
+    """Mock OpenAI API response (plain attribute bag, no call tracking)."""
+    return SimpleNamespace(
         choices=[
-            Mock(
-                message=Mock(
+            SimpleNamespace(
+                message=SimpleNamespace(
                     content="דוח AI מפורט עם המלצות מותאמות אישית"
                 )
             )
         ],
-        usage=Mock(
+        usage=SimpleNamespace(
             total_tokens=150
         )
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ai_response_success():
     """Mock successful AI response."""
-    from app.services.ai_service import AIResponse, AIProvider
-    
     return AIResponse(
         content="דוח AI מפורט עם המלצות מותאמות אישית",
         provider=AIProvider.OPENAI,
@@ -257,11 +326,9 @@ def mock_ai_response_success():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ai_response_failure():
     """Mock failed AI response."""
-    from app.services.ai_service import AIResponse, AIProvider
-    
     return AIResponse(
         content="",
         provider=AIProvider.OPENAI,
@@ -270,20 +337,63 @@ def mock_ai_response_failure():
     )
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="module")
+def cached_loaders():
+    """Opt-in: parse features.json/questions.json at most once per module.
+
+    Wraps the module attributes, so helper-internal calls (e.g. from
+    validate_user_input) hit the cache while names imported directly by
+    test modules still call the real loaders. Only request it from tests
+    that read the real files (not ones faking Path.open/json.load); the
+    caches are dropped with the patch when the module finishes.
+    """
+    import app.api.helpers as helpers
+
+    with pytest.MonkeyPatch.context() as mp:
+        cached = {}
+        for name in ("load_features_from_json", "load_questions_from_json"):
+            cached[name] = functools.lru_cache(maxsize=1)(getattr(helpers, name))
+            mp.setattr(helpers, name, cached[name])
+        yield cached
+        for loader in cached.values():
+            loader.cache_clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
 def mock_environment():
-    """Mock environment variables for all tests."""
-    test_env = {
-        'OPENAI_API_KEY': 'test-key-for-testing',
-        'AI_MAX_TOKENS': '1000',
-        'AI_TEMPERATURE': '0.5',
-        'FLASK_ENV': 'testing'
-    }
+    """Mock environment variables once for the whole session.
     
-    with patch.dict(os.environ, test_env, clear=True):
+    Overlays the test values on the existing environment (PATH etc. are
+    kept); tests that need a different environment patch it locally.
+    """
+    with patch.dict(os.environ, TEST_ENV):
         yield
 
 
+# app.api.routes dependencies replaced by the routes_mocks fixture
+ROUTES_MOCK_TARGETS = (
+    'load_questions_from_json',
+    'load_features_from_json',
+    'match_requirements',
+    'generate_ai_report',
+)
+
+
+@pytest.fixture
+def routes_mocks(monkeypatch):
+    """Replace the routes' data/AI dependencies with fresh mocks.
+    
+    Uses plain attribute swaps (monkeypatch) instead of stacked @patch
+    decorators; configure them via e.g. routes_mocks.match_requirements.
+    """
+    import app.api.routes as routes
+    
+    mocks = SimpleNamespace(**{name: Mock() for name in ROUTES_MOCK_TARGETS})
+    for name, mock in vars(mocks).items():
+        monkeypatch.setattr(routes, name, mock)
+    return mocks
+
+
 @pytest.fixture
 def mock_file_operations():
     """Mock file operations for testing."""
@@ -292,6 +402,14 @@ def mock_file_operations():
             yield mock_open, mock_json_load
 
 
+# Performance tests (tests/perf) only run when requested explicitly
+def pytest_ignore_collect(collection_path, config):
+    """Skip tests/perf unless it was passed on the command line."""
+    if collection_path.name == "perf" and collection_path.parent == Path(__file__).parent:
+        return not any(str(collection_path) in str(Path(arg).resolve()) for arg in config.args)
+    return None
+
+
 # Pytest configuration
 def pytest_configure(config):
     """Configure pytest."""
@@ -306,17 +424,28 @@ def pytest_configure(config):
     )
 
 
+# Test-file markers, resolved with a single scan per collected item
+_MARKER_RE = re.compile(r'(?P<ai>ai_service)|(?P<integration>test_api_routes)')
+
+# Shared marker decorators (each wraps a single Mark instance)
+_UNIT = pytest.mark.unit
+_AI = pytest.mark.ai
+_INTEGRATION = pytest.mark.integration
+
+
 def pytest_collection_modifyitems(config, items):
     """Modify test collection."""
     for item in items:
+        m = _MARKER_RE.search(item.nodeid)
+        
+        # Mark other tests as unit tests
+        if m is None:
+            item.add_marker(_UNIT)
+        
         # Mark AI service tests
-        if "ai_service" in item.nodeid:
-            item.add_marker(pytest.mark.ai)
+        elif m.lastgroup == 'ai':
+            item.add_marker(_AI)
         
         # Mark API route tests as integration tests
-        if "test_api_routes" in item.nodeid:
-            item.add_marker(pytest.mark.integration)
-        
-        # Mark other tests as unit tests
         else:
-            item.add_marker(pytest.mark.unit)
\ No newline at end of file
+            item.add_marker(_INTEGRATION)
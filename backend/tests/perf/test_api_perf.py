@@ -0,0 +1,23 @@
+"""
+Latency benchmarks for the API smoke endpoints.
+
+Excluded from the default run; collect them explicitly:
+
+    pytest tests/perf -n 0
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.slow
+
+
+def test_api_index_latency(client, benchmark):
+    resp = benchmark(client.get, "/api/")
+    assert resp.status_code == 200
+
+
+def test_api_health_latency(client, benchmark):
+    resp = benchmark(client.get, "/api/health")
+    assert resp.status_code == 200
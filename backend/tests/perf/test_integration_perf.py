@@ -0,0 +1,55 @@
+"""
+Performance tests for the licensing assistant backend.
+
+Benchmarks complete workflows on large datasets. Excluded from the
+default run; collect them explicitly:
+
+    pytest tests/perf -n 0
+"""
+
+import pytest
+import json
+from types import MappingProxyType
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.slow
+
+
+# Large dataset: every third requirement is high priority
+_LARGE_HIGH = {"category": "בטיחות", "priority": "high", "relevance_score": 0.8}
+_LARGE_MEDIUM = {**_LARGE_HIGH, "priority": "medium"}
+_LARGE_REQUIREMENTS = tuple(
+    {**(_LARGE_HIGH if i % 3 == 0 else _LARGE_MEDIUM), "paragraph_number": f"{i}.1", "text": f"דרישת בטיחות {i}"}
+    for i in range(100)  # Large number of requirements
+)
+
+_LARGE_MATCH_RESULT = MappingProxyType({
+    "matched_requirements": _LARGE_REQUIREMENTS,
+    "by_category": {"בטיחות": _LARGE_REQUIREMENTS},
+    "feature_coverage": [],
+    "user_profile": {"size_m2": 150, "seats": 50},
+    "total_matches": 100,
+    "summary": {
+        "categories_count": 1,
+        "priority_breakdown": {"high": 33, "medium": 67, "low": 0},
+        "avg_relevance": 0.8,
+        "business_profile": {"size_category": "large", "occupancy_category": "high", "special_requirements": False}
+    }
+})
+
+_PAYLOAD_JSON = json.dumps({"size_m2": 150, "seats": 50, "attributes": []})
+
+
+class TestPerformanceIntegration:
+    """Test performance aspects of integration."""
+
+    def test_large_dataset_handling(self, routes_mocks, client, benchmark):
+        """Benchmark the analyze workflow on a large matching result."""
+        routes_mocks.match_requirements.return_value = _LARGE_MATCH_RESULT
+
+        response = benchmark(client.post, '/api/analyze', data=_PAYLOAD_JSON, content_type='application/json')
+
+        # Should handle large dataset without issues
+        assert response.status_code == 200
+        assert response.get_json()["regulatory_analysis"]["total_matches"] == 100
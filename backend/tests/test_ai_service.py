@@ -7,19 +7,76 @@ prompt generation, and error handling.
 
 import pytest
 import os
-import sys
-from unittest.mock import Mock, patch, MagicMock
+from contextlib import ExitStack
+from unittest.mock import patch
 
-# Add the backend directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.services.ai_service import AIService, AIProvider, AIResponse, OpenAIStrategy
 
-# Mock external dependencies before importing app
-with patch.dict('sys.modules', {
-    'flask_cors': Mock(),
-    'openai': Mock(),
-    'anthropic': Mock(),
-}):
-    from app.services.ai_service import AIService, AIProvider, AIResponse, OpenAIStrategy
+
+# Business data used by the prompt generation tests
+COMPREHENSIVE_DATA = {
+    "size_m2": 150,
+    "seats": 50,
+    "attributes": ["גז", "בשר"],
+    "matched_requirements": [],
+    "by_category": {
+        "בטיחות": [
+            {
+                "category": "בטיחות",
+                "paragraph_number": "1.1",
+                "text": "דרישת בטיחות",
+                "priority": "high"
+            }
+        ]
+    }
+}
+
+CHECKLIST_DATA = {
+    "size_m2": 100,
+    "seats": 30,
+    "attributes": [],
+    "matched_requirements": [],
+    "by_category": {}
+}
+
+UNICODE_ATTRIBUTES_DATA = {
+    "size_m2": 200,
+    "seats": 75,
+    "attributes": ["מצלמות אבטחה", "אזור עישון", "שימוש בגז"],
+    "matched_requirements": [],
+    "by_category": {}
+}
+
+REQUIREMENTS_DATA = {
+    "size_m2": 100,
+    "seats": 40,
+    "attributes": [],
+    "matched_requirements": [],
+    "by_category": {
+        "בטיחות": [
+            {
+                "category": "בטיחות",
+                "paragraph_number": "1.1",
+                "text": "דרישת בטיחות חשובה",
+                "priority": "high"
+            },
+            {
+                "category": "בטיחות",
+                "paragraph_number": "1.2",
+                "text": "דרישת בטיחות נוספת",
+                "priority": "medium"
+            }
+        ],
+        "כיבוי אש": [
+            {
+                "category": "כיבוי אש",
+                "paragraph_number": "2.1",
+                "text": "דרישת כיבוי אש",
+                "priority": "high"
+            }
+        ]
+    }
+}
 
 
 class TestAIResponse:
@@ -53,11 +110,11 @@ class TestOpenAIStrategy:
             assert strategy.client is None
             assert strategy.is_available() is False
     
+    @pytest.mark.skip(reason="Skipping due to complex import mocking requirements")
     def test_openai_strategy_initialization_with_key(self):
         """Test OpenAI strategy initialization with API key."""
-        # Skip this test due to complex import mocking requirements
-        pytest.skip("Skipping due to complex import mocking requirements")
-    
+        pass
+
     def test_generate_report_no_client(self):
         """Test report generation when client is not available."""
         strategy = OpenAIStrategy()
@@ -69,15 +126,15 @@ class TestOpenAIStrategy:
         assert response.provider == AIProvider.OPENAI
         assert "not available" in response.error_message
     
+    @pytest.mark.skip(reason="Skipping due to complex import mocking requirements")
     def test_generate_report_success(self):
         """Test successful report generation."""
-        # Skip this test due to complex import mocking requirements
-        pytest.skip("Skipping due to complex import mocking requirements")
-    
+        pass
+
+    @pytest.mark.skip(reason="Skipping due to complex import mocking requirements")
     def test_generate_report_api_error(self):
         """Test report generation with API error."""
-        # Skip this test due to complex import mocking requirements
-        pytest.skip("Skipping due to complex import mocking requirements")
+        pass
 
 
 class TestAIService:
@@ -90,63 +147,16 @@ class TestAIService:
         assert len(service.provider_order) == 1
         assert service.provider_order[0] == AIProvider.OPENAI
     
-    def test_get_available_providers(self):
+    def test_get_available_providers(self, ai_service_instance, openai_strategy):
         """Test getting available providers."""
-        service = AIService()
-        with patch.object(service.strategies[AIProvider.OPENAI], 'is_available', return_value=True):
+        service = ai_service_instance
+        with patch.object(openai_strategy, 'is_available', return_value=True):
             providers = service.get_available_providers()
             assert AIProvider.OPENAI in providers
     
-    def test_create_report_prompt_comprehensive(self):
-        """Test comprehensive report prompt generation."""
-        service = AIService()
-        business_data = {
-            "size_m2": 150,
-            "seats": 50,
-            "attributes": ["גז", "בשר"],
-            "matched_requirements": [],
-            "by_category": {
-                "בטיחות": [
-                    {
-                        "category": "בטיחות",
-                        "paragraph_number": "1.1",
-                        "text": "דרישת בטיחות",
-                        "priority": "high"
-                    }
-                ]
-            }
-        }
-        
-        prompt = service._create_report_prompt(business_data, "comprehensive")
-        
-        assert "פרטי העסק" in prompt
-        assert "150 מ\"ר" in prompt
-        assert "50" in prompt
-        assert "גז, בשר" in prompt
-        assert "דוח מפורט" in prompt
-        assert "בטיחות" in prompt
-    
-    def test_create_report_prompt_checklist(self):
-        """Test checklist report prompt generation."""
-        service = AIService()
-        business_data = {
-            "size_m2": 100,
-            "seats": 30,
-            "attributes": [],
-            "matched_requirements": [],
-            "by_category": {}
-        }
-        
-        prompt = service._create_report_prompt(business_data, "checklist")
-        
-        assert "פרטי העסק" in prompt
-        assert "100 מ\"ר" in prompt
-        assert "רשימת בדיקה" in prompt
-        assert "קטגוריות" in prompt
-    
-    def test_generate_smart_report_success(self):
+    def test_generate_smart_report_success(self, ai_service_instance, openai_strategy):
         """Test successful smart report generation."""
-        service = AIService()
+        service = ai_service_instance
         business_data = {
             "size_m2": 150,
             "seats": 50,
@@ -154,131 +164,66 @@ class TestAIService:
             "matched_requirements": [],
             "by_category": {}
         }
+        mock_response = AIResponse(
+            content="Test report",
+            provider=AIProvider.OPENAI,
+            success=True,
+            tokens_used=100,
+            model_used="gpt-4o-mini"
+        )
         
-        with patch.object(service.strategies[AIProvider.OPENAI], 'is_available', return_value=True):
-            with patch.object(service.strategies[AIProvider.OPENAI], 'generate_report') as mock_generate:
-                mock_response = AIResponse(
-                    content="Test report",
-                    provider=AIProvider.OPENAI,
-                    success=True,
-                    tokens_used=100,
-                    model_used="gpt-4o-mini"
-                )
-                mock_generate.return_value = mock_response
-                
-                response = service.generate_smart_report(business_data)
-                
-                assert response.success is True
-                assert response.content == "Test report"
-                mock_generate.assert_called_once()
+        with ExitStack() as stack:
+            stack.enter_context(patch.object(openai_strategy, 'is_available', return_value=True))
+            mock_generate = stack.enter_context(
+                patch.object(openai_strategy, 'generate_report', return_value=mock_response)
+            )
+            
+            response = service.generate_smart_report(business_data)
+            
+            assert response.success is True
+            assert response.content == "Test report"
+            mock_generate.assert_called_once()
     
-    def test_generate_smart_report_unavailable(self):
+    def test_generate_smart_report_unavailable(self, ai_service_instance, openai_strategy):
         """Test smart report generation when OpenAI is unavailable."""
-        service = AIService()
+        service = ai_service_instance
         business_data = {"size_m2": 150, "seats": 50}
         
-        with patch.object(service.strategies[AIProvider.OPENAI], 'is_available', return_value=False):
+        with patch.object(openai_strategy, 'is_available', return_value=False):
             response = service.generate_smart_report(business_data)
             
             assert response.success is False
             assert "not available" in response.error_message
             assert "API key" in response.error_message
 
-
 class TestGenerateAIFunction:
     """Test the convenience function."""
     
+    @pytest.mark.skip(reason="Skipping due to complex import mocking requirements")
     def test_generate_ai_report_function(self):
         """Test the generate_ai_report convenience function."""
-        # This test is already covered by other tests, skip to avoid import issues
-        pytest.skip("Skipping due to complex import mocking requirements")
-        
-        business_data = {"size_m2": 150, "seats": 50}
-        
-        with patch('app.services.ai_service.ai_service') as mock_service:
-            mock_response = AIResponse(
-                content="Test report",
-                provider=AIProvider.OPENAI,
-                success=True
-            )
-            mock_service.generate_smart_report.return_value = mock_response
-            
-            response = generate_ai_report(business_data, "comprehensive")
-            
-            assert response.success is True
-            mock_service.generate_smart_report.assert_called_once_with(business_data, "comprehensive")
+        pass
 
 
 class TestPromptGeneration:
     """Test prompt generation edge cases."""
     
-    def test_prompt_with_empty_data(self):
-        """Test prompt generation with empty business data."""
-        service = AIService()
-        business_data = {}
-        
-        prompt = service._create_report_prompt(business_data)
-        
-        assert "פרטי העסק" in prompt
-        assert "0 מ\"ר" in prompt
-        assert "0" in prompt
-        assert "אין" in prompt
-    
-    def test_prompt_with_unicode_attributes(self):
-        """Test prompt generation with Hebrew attributes."""
-        service = AIService()
-        business_data = {
-            "size_m2": 200,
-            "seats": 75,
-            "attributes": ["מצלמות אבטחה", "אזור עישון", "שימוש בגז"],
-            "matched_requirements": [],
-            "by_category": {}
-        }
-        
-        prompt = service._create_report_prompt(business_data)
-        
-        assert "200 מ\"ר" in prompt
-        assert "75" in prompt
-        assert "מצלמות אבטחה, אזור עישון, שימוש בגז" in prompt
-    
-    def test_prompt_with_requirements(self):
-        """Test prompt generation with regulatory requirements."""
-        service = AIService()
-        business_data = {
-            "size_m2": 100,
-            "seats": 40,
-            "attributes": [],
-            "matched_requirements": [],
-            "by_category": {
-                "בטיחות": [
-                    {
-                        "category": "בטיחות",
-                        "paragraph_number": "1.1",
-                        "text": "דרישת בטיחות חשובה",
-                        "priority": "high"
-                    },
-                    {
-                        "category": "בטיחות", 
-                        "paragraph_number": "1.2",
-                        "text": "דרישת בטיחות נוספת",
-                        "priority": "medium"
-                    }
-                ],
-                "כיבוי אש": [
-                    {
-                        "category": "כיבוי אש",
-                        "paragraph_number": "2.1",
-                        "text": "דרישת כיבוי אש",
-                        "priority": "high"
-                    }
-                ]
-            }
-        }
-        
-        prompt = service._create_report_prompt(business_data)
-        
-        assert "בטיחות" in prompt
-        assert "כיבוי אש" in prompt
-        assert "HIGH" in prompt
-        assert "MEDIUM" in prompt
-        assert "דרישת בטיחות חשובה" in prompt
+    @pytest.mark.parametrize("business_data,report_type,expected_substrings", [
+        (COMPREHENSIVE_DATA, "comprehensive",
+         ["פרטי העסק", "150 מ\"ר", "50", "גז, בשר", "דוח מפורט", "בטיחות"]),
+        (CHECKLIST_DATA, "checklist",
+         ["פרטי העסק", "100 מ\"ר", "רשימת בדיקה", "קטגוריות"]),
+        ({}, None,
+         ["פרטי העסק", "0 מ\"ר", "0", "אין"]),
+        (UNICODE_ATTRIBUTES_DATA, None,
+         ["200 מ\"ר", "75", "מצלמות אבטחה, אזור עישון, שימוש בגז"]),
+        (REQUIREMENTS_DATA, None,
+         ["בטיחות", "כיבוי אש", "HIGH", "MEDIUM", "דרישת בטיחות חשובה"]),
+    ], ids=["comprehensive", "checklist", "empty_data", "unicode_attributes", "requirements"])
+    def test_prompt(self, ai_service_instance, business_data, report_type, expected_substrings):
+        """Test report prompt generation for different business data and report types."""
+        kwargs = {"report_type": report_type} if report_type else {}
+        prompt = ai_service_instance._create_report_prompt(business_data, **kwargs)
+        
+        missing = [n for n in expected_substrings if n not in prompt]
+        assert not missing, missing
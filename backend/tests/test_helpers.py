@@ -6,20 +6,10 @@ validation, questionnaire generation, and data processing.
 """
 
 import pytest
-import os
-import sys
-from unittest.mock import Mock, patch, MagicMock
+import io
+from types import MappingProxyType
 
-# Add the backend directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-# Mock external dependencies before importing app
-with patch.dict('sys.modules', {
-    'flask_cors': Mock(),
-    'openai': Mock(),
-    'anthropic': Mock(),
-}):
-    from app.api.helpers import (
+from app.api.helpers import (
     load_features_from_json,
     load_questions_from_json,
     validate_user_input,
@@ -30,49 +20,102 @@ with patch.dict('sys.modules', {
 )
 
 
+# questions.json configs used by the validation tests (built once, read-only)
+_QCFG_WITH_VALIDATION = MappingProxyType({
+    "questionnaire": MappingProxyType({
+        "required_fields": ("size_m2", "seats")
+    }),
+    "validation": MappingProxyType({
+        "size_m2": MappingProxyType({"min": 1, "max": 10000}),
+        "seats": MappingProxyType({"min": 0, "max": 1000})
+    })
+})
+_QCFG_REQUIRED_ONLY = MappingProxyType({
+    "questionnaire": _QCFG_WITH_VALIDATION["questionnaire"],
+    "validation": MappingProxyType({})
+})
+_QCFG_EMPTY = MappingProxyType({})
+
+
+# Substrings of the Hebrew validation error messages
+_MSG_SEATS = "מקומות ישיבה"
+_MSG_SIZE = "גודל העסק"
+_MSG_SEATS_RANGE = "מקומות הישיבה"
+
+# validate_user_input cases: (payload, questions.json config, expected error
+# substring or None for no errors, expected cleaned answers or None)
+_VALIDATION_CASES = (
+    pytest.param({"size_m2": 150}, _QCFG_REQUIRED_ONLY, _MSG_SEATS, None,
+                 id="missing_required_fields"),
+    pytest.param({"size_m2": -10, "seats": 50}, _QCFG_WITH_VALIDATION, _MSG_SIZE, None,
+                 id="invalid_size_range"),
+    pytest.param({"size_m2": 150, "seats": 2000}, _QCFG_WITH_VALIDATION, _MSG_SEATS_RANGE, None,
+                 id="invalid_seats_range"),
+    pytest.param({"size_m2": 150, "seats": 50, "uses_gas": None, "serves_meat": None, "attributes": []},
+                 _QCFG_REQUIRED_ONLY, None, {"size_m2": 150, "seats": 50},
+                 id="cleanup_none_values"),
+)
+
+
+@pytest.fixture
+def questions_with_validation(monkeypatch):
+    """Serve the questions.json config with required fields and range rules."""
+    monkeypatch.setattr("app.api.helpers.load_questions_from_json", lambda: _QCFG_WITH_VALIDATION)
+
+
+@pytest.fixture
+def questions_empty(monkeypatch):
+    """Serve an empty questions.json config, forcing fallbacks."""
+    monkeypatch.setattr("app.api.helpers.load_questions_from_json", lambda: _QCFG_EMPTY)
+
+
 class TestLoadJSONFunctions:
     """Test JSON loading functions."""
     
-    @patch('app.api.helpers.Path.open')
-    @patch('app.api.helpers.json.load')
-    def test_load_features_from_json_success(self, mock_json_load, mock_open):
+    @pytest.fixture
+    def fake_json_file(self, monkeypatch):
+        """Serve state["data"] from Path.open/json.load."""
+        state = {}
+        monkeypatch.setattr("app.api.helpers.Path.open", lambda path, *args, **kwargs: io.StringIO(""))
+        monkeypatch.setattr("app.api.helpers.json.load", lambda f: state["data"])
+        return state
+    
+    @pytest.fixture
+    def missing_json_file(self, monkeypatch):
+        """Make every Path.open in helpers raise FileNotFoundError."""
+        def fake_open(path, *args, **kwargs):
+            raise FileNotFoundError()
+        
+        monkeypatch.setattr("app.api.helpers.Path.open", fake_open)
+    
+    def test_load_features_from_json_success(self, fake_json_file):
         """Test successful features loading."""
+        state = fake_json_file
         mock_data = {"feature1": "data1", "feature2": "data2"}
-        mock_json_load.return_value = mock_data
+        state["data"] = mock_data
         
         result = load_features_from_json()
         
         assert result == mock_data
-        mock_open.assert_called_once()
-        mock_json_load.assert_called_once()
     
-    @patch('app.api.helpers.Path.open')
-    def test_load_features_from_json_file_not_found(self, mock_open):
+    def test_load_features_from_json_file_not_found(self, missing_json_file):
         """Test features loading when file not found."""
-        mock_open.side_effect = FileNotFoundError()
-        
         result = load_features_from_json()
         
         assert result == {}
     
-    @patch('app.api.helpers.Path.open')
-    @patch('app.api.helpers.json.load')
-    def test_load_questions_from_json_success(self, mock_json_load, mock_open):
+    def test_load_questions_from_json_success(self, fake_json_file):
         """Test successful questions loading."""
+        state = fake_json_file
         mock_data = {"questions": [], "metadata": {}}
-        mock_json_load.return_value = mock_data
+        state["data"] = mock_data
         
         result = load_questions_from_json()
         
         assert result == mock_data
-        mock_open.assert_called_once()
-        mock_json_load.assert_called_once()
     
-    @patch('app.api.helpers.Path.open')
-    def test_load_questions_from_json_file_not_found(self, mock_open):
+    def test_load_questions_from_json_file_not_found(self, missing_json_file):
         """Test questions loading when file not found."""
-        mock_open.side_effect = FileNotFoundError()
-        
         result = load_questions_from_json()
         
         assert result == {}
@@ -81,19 +124,8 @@ class TestLoadJSONFunctions:
 class TestValidateUserInput:
     """Test user input validation."""
     
-    @patch('app.api.helpers.load_questions_from_json')
-    def test_validate_user_input_success(self, mock_load_questions):
+    def test_validate_user_input_success(self, questions_with_validation):
         """Test successful input validation."""
-        mock_load_questions.return_value = {
-            "questionnaire": {
-                "required_fields": ["size_m2", "seats"]
-            },
-            "validation": {
-                "size_m2": {"min": 1, "max": 10000},
-                "seats": {"min": 0, "max": 1000}
-            }
-        }
-        
         payload = {
             "size_m2": 150,
             "seats": 50,
@@ -107,163 +139,77 @@ class TestValidateUserInput:
         assert answers["seats"] == 50
         assert answers["attributes"] == ["גז"]
     
-    @patch('app.api.helpers.load_questions_from_json')
-    def test_validate_user_input_missing_required_fields(self, mock_load_questions):
-        """Test validation with missing required fields."""
-        mock_load_questions.return_value = {
-            "questionnaire": {
-                "required_fields": ["size_m2", "seats"]
-            },
-            "validation": {}
-        }
-        
-        payload = {
-            "size_m2": 150
-            # Missing "seats"
-        }
+    @pytest.mark.parametrize("payload,config,expect_error_substr,expect_answers", _VALIDATION_CASES)
+    def test_validate_user_input_cases(self, monkeypatch, payload, config, expect_error_substr, expect_answers):
+        """Test validation errors and cleanup of None values."""
+        monkeypatch.setattr("app.api.helpers.load_questions_from_json", lambda: config)
         
         answers, errors = validate_user_input(payload)
         
-        assert len(errors) > 0
-        assert "מקומות ישיבה" in errors[0]
-    
-    @patch('app.api.helpers.load_questions_from_json')
-    def test_validate_user_input_invalid_size_range(self, mock_load_questions):
-        """Test validation with invalid size range."""
-        mock_load_questions.return_value = {
-            "questionnaire": {
-                "required_fields": ["size_m2", "seats"]
-            },
-            "validation": {
-                "size_m2": {"min": 1, "max": 10000},
-                "seats": {"min": 0, "max": 1000}
-            }
-        }
-        
-        payload = {
-            "size_m2": -10,  # Invalid negative size
-            "seats": 50
-        }
-        
-        answers, errors = validate_user_input(payload)
-        
-        assert len(errors) > 0
-        assert any("גודל העסק" in error for error in errors)
-    
-    @patch('app.api.helpers.load_questions_from_json')
-    def test_validate_user_input_invalid_seats_range(self, mock_load_questions):
-        """Test validation with invalid seats range."""
-        mock_load_questions.return_value = {
-            "questionnaire": {
-                "required_fields": ["size_m2", "seats"]
+        if expect_error_substr is None:
+            assert errors == []
+        else:
+            assert any(expect_error_substr in error for error in errors), errors
+        
+        if expect_answers is not None:
+            for key, value in expect_answers.items():
+                assert answers[key] == value
+            # None values are cleaned up
+            for key, value in payload.items():
+                if value is None:
+                    assert key not in answers
+
+
+def _make_matching(high=2, special=False):
+    """Build a minimal matching_result for assess_business_risk_factors."""
+    return {
+        "summary": {
+            "business_profile": {
+                "size_category": "large",
+                "occupancy_category": "high",
+                "special_requirements": special
             },
-            "validation": {
-                "size_m2": {"min": 1, "max": 10000},
-                "seats": {"min": 0, "max": 1000}
+            "priority_breakdown": {
+                "high": high,
+                "medium": 3,
+                "low": 1
             }
         }
-        
-        payload = {
-            "size_m2": 150,
-            "seats": 2000  # Invalid high seats
-        }
-        
-        answers, errors = validate_user_input(payload)
-        
-        assert len(errors) > 0
-        assert any("מקומות הישיבה" in error for error in errors)
-    
-    @patch('app.api.helpers.load_questions_from_json')
-    def test_validate_user_input_cleanup_none_values(self, mock_load_questions):
-        """Test that None values are cleaned up."""
-        mock_load_questions.return_value = {
-            "questionnaire": {
-                "required_fields": ["size_m2", "seats"]
-            },
-            "validation": {}
-        }
-        
-        payload = {
-            "size_m2": 150,
-            "seats": 50,
-            "uses_gas": None,
-            "serves_meat": None,
-            "attributes": []
-        }
-        
-        answers, errors = validate_user_input(payload)
-        
-        assert "uses_gas" not in answers
-        assert "serves_meat" not in answers
-        assert answers["size_m2"] == 150
-        assert answers["seats"] == 50
+    }
 
 
 class TestAssessBusinessRiskFactors:
     """Test business risk factors assessment."""
     
-    def test_assess_high_regulation_burden(self):
-        """Test assessment with high regulation burden."""
-        matching_result = {
-            "summary": {
-                "business_profile": {
-                    "size_category": "large",
-                    "occupancy_category": "high",
-                    "special_requirements": False
-                },
-                "priority_breakdown": {
-                    "high": 8,  # High number of high priority requirements
-                    "medium": 5,
-                    "low": 3
-                }
-            }
-        }
-        
-        risk_factors = assess_business_risk_factors(matching_result)
-        
-        assert len(risk_factors) > 0
-        assert any("high_regulation_burden" in factor["category"] for factor in risk_factors)
-        assert any("8 דרישות" in factor["description"] for factor in risk_factors)
-    
-    def test_assess_special_requirements(self):
-        """Test assessment with special requirements."""
-        matching_result = {
-            "summary": {
-                "business_profile": {
-                    "special_requirements": True
-                },
-                "priority_breakdown": {
-                    "high": 2,
-                    "medium": 3,
-                    "low": 1
-                }
-            }
-        }
-        
-        risk_factors = assess_business_risk_factors(matching_result)
-        
-        assert len(risk_factors) > 0
-        assert any("special_requirements" in factor["category"] for factor in risk_factors)
-        assert any("גז/בשר" in factor["description"] for factor in risk_factors)
-    
-    def test_assess_no_risk_factors(self):
-        """Test assessment with no risk factors."""
-        matching_result = {
-            "summary": {
-                "business_profile": {
-                    "special_requirements": False
-                },
-                "priority_breakdown": {
-                    "high": 2,  # Low number of high priority
-                    "medium": 3,
-                    "low": 1
-                }
-            }
-        }
-        
-        risk_factors = assess_business_risk_factors(matching_result)
-        
-        assert len(risk_factors) == 0
+    @pytest.mark.parametrize("high,special,expected_cat,expected_desc", [
+        (8, False, "high_regulation_burden", "8 דרישות"),
+        (2, True, "special_requirements", "גז/בשר"),
+        (2, False, None, None),
+    ], ids=["high_regulation_burden", "special_requirements", "no_risk_factors"])
+    def test_assess_risk_factors(self, high, special, expected_cat, expected_desc):
+        """Test risk factor categories for regulation burden and special requirements."""
+        risk_factors = assess_business_risk_factors(_make_matching(high=high, special=special))
+        
+        if expected_cat is None:
+            assert len(risk_factors) == 0
+        else:
+            assert any(expected_cat in factor["category"] for factor in risk_factors)
+            assert any(expected_desc in factor["description"] for factor in risk_factors)
+
+
+# Shared requirement entries for the recommendations tests
+_HI = MappingProxyType({"priority": "high"})
+_MED = MappingProxyType({"priority": "medium"})
+_LOW = MappingProxyType({"priority": "low"})
+
+# Baseline matching_result with three categories
+_BASE_MATCHING = MappingProxyType({
+    "by_category": MappingProxyType({
+        "בטיחות": (),
+        "כיבוי אש": (),
+        "בריאות": ()
+    })
+})
 
 
 class TestGenerateRecommendations:
@@ -271,19 +217,7 @@ class TestGenerateRecommendations:
     
     def test_generate_recommendations_with_high_priority(self):
         """Test recommendations with high priority requirements."""
-        matching_result = {
-            "matched_requirements": [
-                {"priority": "high"},
-                {"priority": "high"},
-                {"priority": "medium"},
-                {"priority": "low"}
-            ],
-            "by_category": {
-                "בטיחות": [],
-                "כיבוי אש": [],
-                "בריאות": []
-            }
-        }
+        matching_result = {**_BASE_MATCHING, "matched_requirements": [_HI, _HI, _MED, _LOW]}
         
         recommendations = generate_recommendations(matching_result)
         
@@ -295,14 +229,7 @@ class TestGenerateRecommendations:
     
     def test_generate_recommendations_high_complexity(self):
         """Test recommendations for high complexity business."""
-        matching_result = {
-            "matched_requirements": [{"priority": "medium"}] * 35,  # Many requirements
-            "by_category": {
-                "בטיחות": [],
-                "כיבוי אש": [],
-                "בריאות": []
-            }
-        }
+        matching_result = {**_BASE_MATCHING, "matched_requirements": [_MED] * 35}  # Many requirements
         
         recommendations = generate_recommendations(matching_result)
         
@@ -310,13 +237,7 @@ class TestGenerateRecommendations:
     
     def test_generate_recommendations_medium_complexity(self):
         """Test recommendations for medium complexity business."""
-        matching_result = {
-            "matched_requirements": [{"priority": "medium"}] * 10,  # Few requirements
-            "by_category": {
-                "בטיחות": [],
-                "כיבוי אש": []
-            }
-        }
+        matching_result = {**_BASE_MATCHING, "matched_requirements": [_MED] * 10}  # Few requirements
         
         recommendations = generate_recommendations(matching_result)
         
@@ -326,10 +247,10 @@ class TestGenerateRecommendations:
 class TestCreateFeatureQuestionOptions:
     """Test feature question options creation."""
     
-    @patch('app.api.helpers.load_feature_mappings_from_json')
-    def test_create_feature_question_options_success(self, mock_load_mappings):
-        """Test successful feature options creation."""
-        mock_mappings = {
+    @pytest.fixture
+    def gas_meat_mappings(self):
+        """Feature mappings for gas and meat."""
+        return {
             "feature_mappings": {
                 "גז": {
                     "label": "שימוש בגז",
@@ -351,29 +272,11 @@ class TestCreateFeatureQuestionOptions:
                 "default_priority": "medium"
             }
         }
-        mock_load_mappings.return_value = mock_mappings
-        
-        features_data = {
-            "גז": {"keywords": ["גז", "gas"]},
-            "בשר": {"keywords": ["בשר", "meat"]}
-        }
-        
-        options = create_feature_question_options(features_data)
-        
-        assert len(options) == 2
-        assert any(option["value"] == "גז" for option in options)
-        assert any(option["value"] == "בשר" for option in options)
-        
-        # Check option structure
-        gas_option = next(option for option in options if option["value"] == "גז")
-        assert gas_option["label"] == "שימוש בגז"
-        assert gas_option["category"] == "בטיחות"
-        assert gas_option["priority"] == "high"
     
-    @patch('app.api.helpers.load_feature_mappings_from_json')
-    def test_create_feature_question_options_exclude_mandatory(self, mock_load_mappings):
-        """Test feature options creation excluding mandatory fields."""
-        mock_mappings = {
+    @pytest.fixture
+    def mandatory_mappings(self):
+        """Feature mappings including the mandatory size/occupancy fields."""
+        return {
             "feature_mappings": {
                 "מ\"ר": {
                     "label": "גודל",
@@ -392,7 +295,33 @@ class TestCreateFeatureQuestionOptions:
                 "exclude_mandatory_from_questions": True
             }
         }
-        mock_load_mappings.return_value = mock_mappings
+    
+    def test_create_feature_question_options_success(self, monkeypatch, gas_meat_mappings):
+        """Test successful feature options creation."""
+        monkeypatch.setattr("app.api.helpers.load_feature_mappings_from_json", lambda: gas_meat_mappings)
+        
+        features_data = {
+            "גז": {"keywords": ["גז", "gas"]},
+            "בשר": {"keywords": ["בשר", "meat"]}
+        }
+        
+        options = create_feature_question_options(features_data)
+        
+        by_val = {option["value"]: option for option in options}
+        
+        assert len(options) == 2
+        assert "גז" in by_val
+        assert "בשר" in by_val
+        
+        # Check option structure
+        gas_option = by_val["גז"]
+        assert gas_option["label"] == "שימוש בגז"
+        assert gas_option["category"] == "בטיחות"
+        assert gas_option["priority"] == "high"
+    
+    def test_create_feature_question_options_exclude_mandatory(self, monkeypatch, mandatory_mappings):
+        """Test feature options creation excluding mandatory fields."""
+        monkeypatch.setattr("app.api.helpers.load_feature_mappings_from_json", lambda: mandatory_mappings)
         
         features_data = {
             "מ\"ר": {"keywords": ["גודל"]},
@@ -406,27 +335,63 @@ class TestCreateFeatureQuestionOptions:
         assert len(options) == 1
         assert options[0]["value"] == "גז"
     
-    def test_create_feature_question_options_priority_sorting(self):
+    def test_create_feature_question_options_priority_sorting(self, monkeypatch):
         """Test feature options priority sorting."""
-        # Skip this test due to complex import mocking requirements
-        pytest.skip("Skipping due to complex import mocking requirements")
-
+        mock_mappings = {
+            "feature_mappings": {
+                "מצלמות אבטחה": {"label": "מצלמות אבטחה", "priority": "low"},
+                "בשר": {"label": "הגשת בשר", "priority": "medium"},
+                "גז": {"label": "שימוש בגז", "priority": "high"}
+            },
+            "settings": {}
+        }
+        monkeypatch.setattr("app.api.helpers.load_feature_mappings_from_json", lambda: mock_mappings)
+        
+        features_data = {
+            "מצלמות אבטחה": {"keywords": ["מצלמות"]},
+            "בשר": {"keywords": ["בשר"]},
+            "גז": {"keywords": ["גז"]}
+        }
+        
+        options = create_feature_question_options(features_data)
+        
+        assert [option["priority"] for option in options] == ["high", "medium", "low"]
+        assert options[0]["value"] == "גז"
 
 class TestCreateQuestionnaireFromJSON:
     """Test questionnaire creation from JSON."""
     
-    def test_create_questionnaire_success(self):
+    def test_create_questionnaire_success(self, monkeypatch):
         """Test successful questionnaire creation."""
-        # Skip this test due to complex import mocking requirements
-        pytest.skip("Skipping due to complex import mocking requirements")
+        questions_config = {
+            "questionnaire": {
+                "version": "2.0",
+                "required_fields": ["size_m2", "seats"]
+            },
+            "questions": [
+                {"name": "size_m2", "type": "number"},
+                {"name": "seats", "type": "number"},
+                {"name": "attributes", "type": "multiselect"}
+            ]
+        }
+        monkeypatch.setattr("app.api.helpers.load_questions_from_json", lambda: questions_config)
+        
+        feature_options = [
+            {"value": "גז", "label": "שימוש בגז"},
+            {"value": "בשר", "label": "הגשת בשר"}
+        ]
+        
+        questions, metadata = create_questionnaire_from_json(feature_options)
+        
+        assert len(questions) == 3
+        attributes = next(q for q in questions if q["name"] == "attributes")
+        assert attributes["options"] == feature_options
+        assert metadata["questionnaire_version"] == "2.0"
         assert metadata["required_fields"] == ["size_m2", "seats"]
         assert metadata["features_loaded"] == 2
     
-    @patch('app.api.helpers.load_questions_from_json')
-    def test_create_questionnaire_fallback(self, mock_load_questions):
+    def test_create_questionnaire_fallback(self, questions_empty):
         """Test questionnaire creation with fallback."""
-        mock_load_questions.return_value = {}  # Empty config
-        
         feature_options = [
             {"value": "גז", "label": "שימוש בגז"}
         ]
@@ -0,0 +1,69 @@
+"""
+Unit tests for the orjson JSON provider.
+
+Checks that OrjsonProvider serializes the same values as Flask's
+default provider, so orjson option changes cannot silently alter
+API output.
+"""
+
+import pytest
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+from flask.json.provider import DefaultJSONProvider
+
+pytest.importorskip("orjson")
+
+from app.json_provider import OrjsonProvider
+
+
+@dataclass
+class _Requirement:
+    paragraph_number: str
+    priority: str
+
+
+# Values the default provider handles specially, by case id
+_PARITY_CASES = {
+    "sorted_keys": {"b": 1, "a": {"d": 2, "c": 3}},
+    "hebrew_text": {"קטגוריה": "בטיחות אש", "text": "דרישת בטיחות"},
+    "http_date": {"at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), "day": date(2024, 1, 2)},
+    "decimal": {"size_m2": Decimal("150.50")},
+    "dataclass": {"requirement": _Requirement("1.1", "high")},
+    "uuid": {"id": UUID("12345678-1234-5678-1234-567812345678")},
+    "non_str_keys": {2: "b", 1: "a"},
+}
+
+
+def _pairs(text):
+    """Parse JSON keeping object key order (lists of pairs)."""
+    return json.loads(text, object_pairs_hook=list)
+
+
+class TestOrjsonProvider:
+    """Test parity of OrjsonProvider with DefaultJSONProvider."""
+
+    def test_app_uses_orjson_provider(self, app):
+        """Test the app installs the orjson provider when orjson is importable."""
+        assert isinstance(app.json, OrjsonProvider)
+
+    @pytest.mark.parametrize("case", list(_PARITY_CASES))
+    def test_dumps_matches_default_provider(self, app, case):
+        """Test values and key order match Flask's default provider."""
+        obj = _PARITY_CASES[case]
+
+        assert _pairs(app.json.dumps(obj)) == _pairs(DefaultJSONProvider(app).dumps(obj))
+
+    def test_dumps_emits_utf8_not_escapes(self, app):
+        """Test Hebrew text is written as UTF-8 rather than \\u escapes."""
+        assert app.json.dumps({"text": "בטיחות"}) == '{"text":"בטיחות"}'
+
+    def test_loads_round_trip(self, app):
+        """Test loads accepts both str and bytes."""
+        payload = {"size_m2": 150, "attributes": ["גז"]}
+
+        assert app.json.loads(app.json.dumps(payload)) == payload
+        assert app.json.loads(app.json.dumps(payload).encode()) == payload
@@ -6,20 +6,10 @@ business profile analysis, and feature matching.
 """
 
 import pytest
-import os
-import sys
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
-# Add the backend directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-# Mock external dependencies before importing app
-with patch.dict('sys.modules', {
-    'flask_cors': Mock(),
-    'openai': Mock(),
-    'anthropic': Mock(),
-}):
-    from app.services.matching import (
+from app.services.matching import (
     match_requirements,
     get_applicable_features,
     _normalize_user_input,
@@ -29,6 +19,19 @@ with patch.dict('sys.modules', {
 )
 
 
+@pytest.fixture
+def patched_matching():
+    """Patch the rules-loader lookups used by match_requirements for one test."""
+    with patch('app.services.matching.get_paragraphs') as get_paragraphs, \
+         patch('app.services.matching.get_mappings') as get_mappings, \
+         patch('app.services.matching.get_paragraph_text') as get_paragraph_text:
+        yield SimpleNamespace(
+            get_paragraphs=get_paragraphs,
+            get_mappings=get_mappings,
+            get_paragraph_text=get_paragraph_text
+        )
+
+
 class TestNormalizeUserInput:
     """Test user input normalization."""
     
@@ -165,6 +168,21 @@ class TestExtractNumericRanges:
         
         # Empty text returns empty dict
         assert ranges == {}
+    
+    def test_extract_is_cached_per_text(self):
+        """Test repeated extraction of the same text reuses the cached result."""
+        text = "עסק מעל 100 מ\"ר"
+        
+        assert _extract_numeric_ranges(text) is _extract_numeric_ranges(text)
+    
+    def test_extract_text_without_digits(self):
+        """Test extraction with text that contains no numbers."""
+        ranges = _extract_numeric_ranges("דרישת בטיחות כללית ללא מגבלת גודל")
+        
+        assert ranges == {
+            "size_m2": {"min": None, "max": None, "exact": []},
+            "occupancy": {"min": None, "max": None, "exact": []}
+        }
 
 
 class TestMatchesNumericRequirements:
@@ -294,10 +312,7 @@ class TestGetApplicableFeatures:
 class TestMatchRequirements:
     """Test main matching requirements function."""
     
-    @patch('app.services.matching.get_paragraphs')
-    @patch('app.services.matching.get_mappings')
-    @patch('app.services.matching.get_paragraph_text')
-    def test_match_requirements_success(self, mock_get_text, mock_get_mappings, mock_get_paragraphs):
+    def test_match_requirements_success(self, patched_matching):
         """Test successful requirements matching."""
         # Mock data
         mock_paragraphs = {"category1": {}}
@@ -308,9 +323,9 @@ class TestMatchRequirements:
                 }
             }
         }
-        mock_get_paragraphs.return_value = mock_paragraphs
-        mock_get_mappings.return_value = mock_mappings
-        mock_get_text.return_value = "דרישת בטיחות חשובה"
+        patched_matching.get_paragraphs.return_value = mock_paragraphs
+        patched_matching.get_mappings.return_value = mock_mappings
+        patched_matching.get_paragraph_text.return_value = "דרישת בטיחות חשובה"
         
         user_answers = {
             "size_m2": 150,
@@ -327,15 +342,36 @@ class TestMatchRequirements:
         assert "summary" in result
         assert result["total_matches"] >= 0
     
-    def test_match_requirements_empty_mappings(self):
+    def test_match_requirements_ranges_do_not_alias_cache(self, patched_matching):
+        """Test mutating a response's numeric_ranges leaves the cached extraction intact."""
+        text = "דרישת בטיחות חשובה"
+        patched_matching.get_paragraphs.return_value = {"category1": {}}
+        patched_matching.get_mappings.return_value = {"מ\"ר": {"categories": {"בטיחות": ["1.1"]}}}
+        patched_matching.get_paragraph_text.return_value = text
+        
+        result = match_requirements({"size_m2": 150, "seats": 50, "attributes": []})
+        ranges = result["matched_requirements"][0]["numeric_ranges"]
+        ranges["size_m2"]["min"] = 999
+        ranges["size_m2"]["exact"].append(999)
+        
+        assert _extract_numeric_ranges(text)["size_m2"] == {"min": None, "max": None, "exact": []}
+    
+    def test_match_requirements_empty_mappings(self, patched_matching):
         """Test matching with empty mappings."""
-        # Skip this test due to complex import mocking requirements
-        pytest.skip("Skipping due to complex import mocking requirements")
+        patched_matching.get_paragraphs.return_value = {}
+        patched_matching.get_mappings.return_value = {}
+        
+        result = match_requirements({"size_m2": 150, "seats": 50, "attributes": []})
+        
+        assert result["matched_requirements"] == []
+        assert result["by_category"] == {}
+        assert result["feature_coverage"] == []
+        assert result["total_matches"] == 0
+        assert result["summary"]["categories_count"] == 0
+        assert result["summary"]["avg_relevance"] == 0
+        patched_matching.get_paragraph_text.assert_not_called()
     
-    @patch('app.services.matching.get_paragraphs')
-    @patch('app.services.matching.get_mappings')
-    @patch('app.services.matching.get_paragraph_text')
-    def test_match_requirements_with_priority_assignment(self, mock_get_text, mock_get_mappings, mock_get_paragraphs):
+    def test_match_requirements_with_priority_assignment(self, patched_matching):
         """Test priority assignment in matching results."""
         mock_paragraphs = {"בטיחות": {}}
         mock_mappings = {
@@ -345,9 +381,9 @@ class TestMatchRequirements:
                 }
             }
         }
-        mock_get_paragraphs.return_value = mock_paragraphs
-        mock_get_mappings.return_value = mock_mappings
-        mock_get_text.return_value = "דרישת בטיחות חירום - גלאי עשן"
+        patched_matching.get_paragraphs.return_value = mock_paragraphs
+        patched_matching.get_mappings.return_value = mock_mappings
+        patched_matching.get_paragraph_text.return_value = "דרישת בטיחות חירום - גלאי עשן"
         
         user_answers = {
             "size_m2": 150,
@@ -374,12 +410,10 @@ class TestMatchRequirements:
 class TestBusinessProfileClassification:
     """Test business profile classification."""
     
-    @patch('app.services.matching.get_paragraphs')
-    @patch('app.services.matching.get_mappings')
-    def test_small_business_classification(self, mock_get_mappings, mock_get_paragraphs):
+    def test_small_business_classification(self, patched_matching):
         """Test small business classification."""
-        mock_get_paragraphs.return_value = {}
-        mock_get_mappings.return_value = {}
+        patched_matching.get_paragraphs.return_value = {}
+        patched_matching.get_mappings.return_value = {}
         
         user_answers = {
             "size_m2": 50,  # Small business
@@ -394,12 +428,10 @@ class TestBusinessProfileClassification:
         assert profile["occupancy_category"] == "low"
         assert profile["special_requirements"] is False
     
-    @patch('app.services.matching.get_paragraphs')
-    @patch('app.services.matching.get_mappings')
-    def test_large_business_classification(self, mock_get_mappings, mock_get_paragraphs):
+    def test_large_business_classification(self, patched_matching):
         """Test large business classification."""
-        mock_get_paragraphs.return_value = {}
-        mock_get_mappings.return_value = {}
+        patched_matching.get_paragraphs.return_value = {}
+        patched_matching.get_mappings.return_value = {}
         
         user_answers = {
             "size_m2": 200,  # Large business
@@ -413,3 +445,17 @@ class TestBusinessProfileClassification:
         assert profile["size_category"] == "large"
         assert profile["occupancy_category"] == "high"
         assert profile["special_requirements"] is True
+    
+    @pytest.mark.parametrize("size_m2,seats,expected", [
+        (99, 49, ("small", "low")),
+        (100, 50, ("large", "high")),
+    ], ids=["below_thresholds", "at_thresholds"])
+    def test_classification_thresholds(self, patched_matching, size_m2, seats, expected):
+        """Test tier boundaries: a value equal to a threshold moves up a tier."""
+        patched_matching.get_paragraphs.return_value = {}
+        patched_matching.get_mappings.return_value = {}
+        
+        result = match_requirements({"size_m2": size_m2, "seats": seats, "attributes": []})
+        profile = result["summary"]["business_profile"]
+        
+        assert (profile["size_category"], profile["occupancy_category"]) == expected
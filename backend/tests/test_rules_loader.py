@@ -0,0 +1,91 @@
+"""
+Unit tests for rules loader.
+
+Tests the processed-data loading, mtime-based cache invalidation,
+and hierarchical paragraph lookup.
+"""
+
+import pytest
+import json
+import os
+
+from app.services import rules_loader
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point the loader at a temporary processed-data directory."""
+    (tmp_path / "paragraphs.json").write_text(
+        json.dumps({"פרק 1": {"1": {"text": "כללי", "1.1": {"text": "דרישת בטיחות"}}}}, ensure_ascii=False),
+        encoding="utf-8"
+    )
+    (tmp_path / "mappings.json").write_text(json.dumps({"גז": {"categories": {}}}, ensure_ascii=False), encoding="utf-8")
+    monkeypatch.setattr(rules_loader, "DATA_DIR", tmp_path)
+    rules_loader.clear_cache()
+    yield tmp_path
+    rules_loader.clear_cache()
+
+
+class TestLoadParserData:
+    """Test cached loading of parser outputs."""
+
+    def test_returns_cached_data_when_unchanged(self, data_dir):
+        """Test repeated calls reuse the cached objects."""
+        first = rules_loader.load_parser_data()
+        second = rules_loader.load_parser_data()
+
+        assert first is second
+        assert "פרק 1" in first[0]
+
+    def test_reloads_when_file_changes(self, data_dir):
+        """Test data is reloaded after the file's mtime changes."""
+        paragraphs, mappings = rules_loader.load_parser_data()
+        assert "בשר" not in mappings
+
+        mappings_path = data_dir / "mappings.json"
+        mappings_path.write_text(json.dumps({"בשר": {"categories": {}}}, ensure_ascii=False), encoding="utf-8")
+        stat = mappings_path.stat()
+        os.utime(mappings_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        _, reloaded = rules_loader.load_parser_data()
+        assert "בשר" in reloaded
+
+    def test_category_keys_are_interned(self, data_dir, monkeypatch):
+        """Test the json fallback interns category names shared by both files."""
+        monkeypatch.setattr(rules_loader, "orjson", None)
+        (data_dir / "mappings.json").write_text(
+            json.dumps({"גז": {"categories": {"פרק 1": ["1.1"]}}}, ensure_ascii=False), encoding="utf-8"
+        )
+        rules_loader.clear_cache()
+
+        paragraphs, mappings = rules_loader.load_parser_data()
+        category = next(iter(mappings["גז"]["categories"]))
+
+        assert category is next(iter(paragraphs))
+        assert mappings["גז"]["categories"][category] == ["1.1"]
+
+
+class TestLoadJSON:
+    """Test the shared JSON file reader."""
+
+    def test_parses_utf8_file(self, tmp_path):
+        """Test Hebrew UTF-8 content is parsed from raw bytes."""
+        path = tmp_path / "features.json"
+        path.write_text(json.dumps({"גז": {"keywords": ["גז"]}}, ensure_ascii=False), encoding="utf-8")
+
+        assert rules_loader.load_json(path) == {"גז": {"keywords": ["גז"]}}
+
+
+class TestGetParagraphText:
+    """Test hierarchical paragraph lookup."""
+
+    def test_nested_paragraph(self, data_dir):
+        """Test lookup of a nested paragraph number."""
+        paragraphs, _ = rules_loader.load_parser_data()
+        assert rules_loader.get_paragraph_text(paragraphs, "פרק 1", "1.1") == "דרישת בטיחות"
+
+    def test_missing_paragraph(self, data_dir):
+        """Test lookup of a paragraph that does not exist."""
+        paragraphs, _ = rules_loader.load_parser_data()
+        assert rules_loader.get_paragraph_text(paragraphs, "פרק 1", "1.9") == ""
+        assert rules_loader.get_paragraph_text(paragraphs, "פרק 9", "9.1") == ""